@@ -0,0 +1,51 @@
+"""Per-call overhead of dynamic finders, excluding the database round trip.
+
+"uncached" reproduces the previous behaviour (parse the name, build the WHERE
+clause and render the statement on every call); "cached" is the lookup of the
+compiled method plus binding parameters through its plan.
+
+    python benchmarks/bench_dynamic_finders.py
+"""
+import timeit
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+from claybird.domain.entities import Entity, field
+from claybird.infrastructure.adapters.outbound.persistance.entity_hydratator import EntityHydratator
+from claybird.infrastructure.adapters.outbound.persistance.mysql.mysql_crud_repository import MysqlCrudRepository
+from claybird.infrastructure.adapters.outbound.persistance.mysql.mysql_finder_plan import MysqlFinderPlan
+
+NAME = "find_by_name_like_and_age_greater_than"
+VALUES = ("jo", 30)
+NUMBER = 200_000
+
+
+class User(Entity):
+    id = field(primary_key=True, default=uuid4, type_=UUID)
+    name = field()
+    age = field(type_=int)
+
+
+def main():
+    repo = MysqlCrudRepository(SimpleNamespace(_conn_kwargs={"db": "bench"}))
+    repo.entity_cls = User
+    repo.table_name = "users"
+    columns = frozenset(EntityHydratator(User).columns)
+
+    def uncached():
+        plan = MysqlFinderPlan.compile(NAME, columns)
+        return plan.statement(repo.table_name), plan.bind(VALUES)
+
+    def cached():
+        getattr(repo, NAME)
+        plan = repo._plans[NAME, columns]
+        return plan.statement(repo.table_name), plan.bind(VALUES)
+
+    cached()
+    for label, fn in (("uncached", uncached), ("cached", cached)):
+        elapsed = min(timeit.repeat(fn, number=NUMBER, repeat=5))
+        print(f"{label:>9}: {elapsed / NUMBER * 1e6:.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Entity construction rate: validated __init__ against the trusted fast path.
+
+    python benchmarks/bench_entity_construction.py
+"""
+import time
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from claybird.domain.entities import Entity, field
+
+ROWS = 200_000
+
+
+class User(Entity):
+    id = field(primary_key=True, default=uuid4, type_=UUID)
+    name = field()
+    age = field(type_=int)
+    created_at = field(type_=datetime, default=lambda: datetime(2024, 1, 1))
+
+
+def measure(label, build):
+    start = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start
+    print(f"{label:>18}: {ROWS / elapsed:>12,.0f} entities/s")
+
+
+def main():
+    rows = [{"id": uuid4(), "name": "claybird", "age": 30} for _ in range(ROWS)]
+
+    measure("__init__", lambda: [User(**row) for row in rows])
+    measure("from_trusted", lambda: [User.from_trusted(**row) for row in rows])
+    measure("from_trusted_many", lambda: User.from_trusted_many(rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Per-instance memory of dict-backed and slot-backed entities.
+
+    python benchmarks/bench_entity_memory.py
+"""
+import tracemalloc
+
+from claybird.domain.entities import Entity, field
+
+INSTANCES = 100_000
+
+
+class DictUser(Entity):
+    id = field(primary_key=True, type_=int)
+    name = field()
+    email = field()
+    age = field(type_=int)
+    active = field(type_=bool)
+
+
+class SlotUser(Entity, slots=True):
+    id = field(primary_key=True, type_=int)
+    name = field()
+    email = field()
+    age = field(type_=int)
+    active = field(type_=bool)
+
+
+def measure(entity_cls):
+    # Share the values between runs so only the entity storage is measured
+    values = {"name": "claybird", "email": "claybird@example.com", "age": 30, "active": True}
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [entity_cls.from_trusted(id=i, **values) for i in range(INSTANCES)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    per_instance = (after - before) / len(instances)
+    print(f"{entity_cls.__name__:>9}: {per_instance:>7.1f} bytes/instance")
+
+
+def main():
+    measure(DictUser)
+    measure(SlotUser)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Rows hydrated/deshydrated per second by the compiled and reflective paths.
+
+    python benchmarks/bench_hydration.py
+"""
+import time
+from dataclasses import dataclass
+from uuid import UUID, uuid4
+
+from claybird.domain.entities import Entity, field
+from claybird.infrastructure.adapters.outbound.persistance.entity_hydratator import EntityHydratator
+
+ROWS = 100_000
+
+
+@dataclass
+class Position:
+    lat: int
+    lon: int
+
+
+class User(Entity):
+    id = field(primary_key=True, default=uuid4, type_=UUID)
+    position = field(type_=Position)
+    name = field()
+    age = field(type_=int)
+
+
+def measure(label, fn, items):
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    elapsed = time.perf_counter() - start
+    print(f"{label:>22}: {len(items) / elapsed:>12,.0f} rows/s")
+
+
+def main():
+    hydrator = EntityHydratator(User)
+    entity = User(name="claybird", age=30, position=Position(lat=1, lon=2))
+    rows = [hydrator.deshydrate(entity) for _ in range(ROWS)]
+    entities = [hydrator.hydrate(row) for row in rows]
+
+    measure("reflective hydrate", hydrator.reflective_hydrate, rows)
+    measure("compiled hydrate", hydrator.hydrate, rows)
+    measure("lazy hydrate", hydrator.hydrate_lazy, rows)
+    measure("compiled + read name", lambda row: hydrator.hydrate(row).name, rows)
+    measure("lazy + read name", lambda row: hydrator.hydrate_lazy(row).name, rows)
+    measure("reflective deshydrate", hydrator.reflective_deshydrate, entities)
+    measure("compiled deshydrate", hydrator.deshydrate, entities)
+
+
+if __name__ == "__main__":
+    main()
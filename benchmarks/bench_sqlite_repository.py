@@ -0,0 +1,71 @@
+"""Repository layer throughput against an on-disk SQLite database.
+
+    python benchmarks/bench_sqlite_repository.py
+"""
+import asyncio
+import os
+import tempfile
+import time
+from uuid import UUID, uuid4
+
+from claybird.domain.entities import Entity, field
+from claybird.infrastructure.adapters.outbound.events import EventBus
+from claybird.infrastructure.adapters.outbound.persistance.sqlite.sqlite_crud_repository import SqliteCrudRepository
+from claybird.infrastructure.adapters.outbound.persistance.sqlite.sqlite_pool import SqlitePool
+
+ROWS = 50_000
+SINGLE = 2_000
+
+
+class User(Entity):
+    id = field(primary_key=True, default=uuid4, type_=UUID)
+    name = field()
+    age = field(type_=int)
+
+
+def report(label, count, elapsed):
+    print(f"{label:>22}: {count / elapsed:>12,.0f} rows/s")
+
+
+async def main():
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    pool = await SqlitePool(path).open()
+    repo = SqliteCrudRepository(pool)
+    repo.entity_cls = User
+    await EventBus.emit("start")
+
+    users = [User(name=f"user{i}", age=i % 90) for i in range(ROWS)]
+
+    start = time.perf_counter()
+    for user in users[:SINGLE]:
+        await repo.save(user)
+    report("save", SINGLE, time.perf_counter() - start)
+
+    result = await repo.save_batch(users)
+    report("save_batch", result.rows, result.seconds)
+
+    ids = [user.id for user in users[:SINGLE]]
+    start = time.perf_counter()
+    for id_ in ids:
+        await repo.get(id_)
+    report("sequential get", SINGLE, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(repo.get(id_) for id_ in ids))
+    report("concurrent get", SINGLE, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    count = 0
+    async for _ in repo.stream_all():
+        count += 1
+    report("stream_all", count, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    rows = await repo.find_by_age_less_than(30)
+    report("find_by_age_less_than", len(rows), time.perf_counter() - start)
+
+    await pool.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -4,6 +4,7 @@ from claybird.application.ports.outbound.logger_port import LoggerPort
 from claybird.application.ports.inbound.controller_handler_port import ControllerHandlerPort
 from claybird.application.ports.inbound.server_port import ServerPort
 
+import time
 
 from fastapi import FastAPI
 from claybird.infrastructure.adapters.outbound.events import EventBus
@@ -54,16 +55,60 @@ class Claybird:
 
 
     async def bootstrap(self):
+        started = time.perf_counter()
+        phases = {}
+
         settings_bootstrap = SettingsBootstrap(self.container)
         settings_bootstrap.load_settings(self.settings_path)
+        phases["settings"] = time.perf_counter()
 
         connections_bootstrap = ConnectionsBootstrap(self.container)
         await connections_bootstrap.load_connections_from_settings()
+        phases["connections"] = time.perf_counter()
 
         controllers_bootstrap = ControllersBootstrap(self.container)
         await controllers_bootstrap.load_controllers()
+        phases["controllers"] = time.perf_counter()
         
         await EventBus.emit("start")
+        phases["start"] = time.perf_counter()
+
+        self.startup_report = self._build_startup_report(started, phases)
+        self.container.get(LoggerPort).info(self._format_startup_report(self.startup_report))
+
+    @staticmethod
+    def _build_startup_report(started: float, phases: dict) -> dict:
+        durations = {}
+        previous = started
+        for name, finished in phases.items():
+            durations[name] = finished - previous
+            previous = finished
+
+        repositories = [
+            instance.init_report
+            for instance in EventBus.listeners("start")
+            if getattr(instance, "init_report", None) is not None
+        ]
+
+        return {
+            "seconds": previous - started,
+            "phases": durations,
+            "repositories": sorted(repositories, key=lambda report: report["seconds"], reverse=True),
+        }
+
+    @staticmethod
+    def _format_startup_report(report: dict) -> str:
+        phases = ", ".join(f"{name} {seconds:.3f}s" for name, seconds in report["phases"].items())
+        actions = {}
+        for repository in report["repositories"]:
+            actions[repository["action"]] = actions.get(repository["action"], 0) + 1
+        tables = ", ".join(f"{count} {action}" for action, count in actions.items()) or "none"
+
+        message = f"Started in {report['seconds']:.3f}s ({phases}); tables: {tables}"
+        slowest = report["repositories"][:3]
+        if slowest:
+            message += "; slowest: " + ", ".join(f"{r['table']} {r['seconds']:.3f}s" for r in slowest)
+        return message
 
     async def run(self, host: str = "127.0.0.1", port: int | str = 8000):
         await self.bootstrap()
@@ -71,10 +116,13 @@ class Claybird:
         controller_handler: ControllerHandlerPort = self.container.get(ControllerHandlerPort)
         server: ServerPort = self.container.get(ServerPort)
         
-        await server.run(
-            app=controller_handler.app,
-            host=host, 
-            port=port
-        )
+        try:
+            await server.run(
+                app=controller_handler.app,
+                host=host, 
+                port=port
+            )
+        finally:
+            await EventBus.emit("shutdown")
 
         
\ No newline at end of file
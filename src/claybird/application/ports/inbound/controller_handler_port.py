@@ -11,4 +11,8 @@ class ControllerHandlerPort(ABC):
 
     @abstractmethod
     def load_controller(self, controller):
+        pass
+
+    @abstractmethod
+    def use_request_scope(self, open_scope):
         pass
\ No newline at end of file
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+class CacheBackendPort(ABC):
+
+    @abstractmethod
+    async def get(self, key):
+        pass
+
+    @abstractmethod
+    async def set(self, key, value):
+        pass
+
+    @abstractmethod
+    async def delete(self, key):
+        pass
+
+    @abstractmethod
+    async def clear(self):
+        pass
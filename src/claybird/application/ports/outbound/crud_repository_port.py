@@ -1,8 +1,31 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, get_args
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar, get_args
 
 T = TypeVar("T")
 
+
+@dataclass
+class Page(Generic[T]):
+    items: list[T] = field(default_factory=list)
+    next_after: Any = None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_after is not None
+
+
+@dataclass
+class BatchResult:
+    rows: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
 class CrudRepositoryPort(ABC, Generic[T]):
 
     @abstractmethod
@@ -14,13 +37,25 @@ class CrudRepositoryPort(ABC, Generic[T]):
         pass
 
     @abstractmethod
-    async def get(self, id):
+    async def get(self, id, fields=None):
+        pass
+
+    @abstractmethod
+    async def get_many(self, ids):
         pass
 
     @abstractmethod
-    async def get_all(self):
+    async def get_all(self, fields=None):
         pass
 
     @abstractmethod
     async def save_batch(self, entities):
+        pass
+
+    @abstractmethod
+    def stream_all(self, chunk_size: int | None = None, fields=None):
+        pass
+
+    @abstractmethod
+    async def page(self, after=None, limit=None, order_by=None):
         pass
\ No newline at end of file
@@ -12,4 +12,7 @@ class DependencyContainerPort(ABC):
 
     @abstractmethod
     def has(self, key):
-        pass
\ No newline at end of file
+        pass
+
+    def get_lifetime(self, key):
+        return None
\ No newline at end of file
@@ -4,4 +4,8 @@ class DependencyInjectorPort:
 
     @abstractmethod
     def inject(self, target):
+        pass
+
+    @abstractmethod
+    def request_scope(self):
         pass
\ No newline at end of file
@@ -12,4 +12,22 @@ class EventBusPort(ABC):
     @abstractmethod
     async def emit(cls):
         """Emit an event asynchronously."""
-        pass
\ No newline at end of file
+        pass
+
+    @classmethod
+    @abstractmethod
+    async def emit_ordered(cls):
+        """Emit an event, running handlers one after another."""
+        pass
+
+    @classmethod
+    @abstractmethod
+    def emit_nowait(cls):
+        """Emit an event in the background without waiting for handlers."""
+        pass
+
+    @classmethod
+    @abstractmethod
+    def listeners(cls):
+        """Return the live instances listening to an event."""
+        pass
@@ -0,0 +1,7 @@
+from abc import ABC, abstractmethod
+
+class UnitOfWorkPort(ABC):
+
+    @abstractmethod
+    def transaction(self):
+        pass
@@ -0,0 +1,165 @@
+import functools
+from typing import Any
+
+from claybird.application.ports.outbound.cache_backend_port import CacheBackendPort
+from claybird.application.ports.outbound.crud_repository_port import CrudRepositoryPort
+
+
+class CachedCrudRepository(CrudRepositoryPort):
+
+    def __init__(self, impl: CrudRepositoryPort, backend: CacheBackendPort):
+        self.impl = impl
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        # Reads in flight per key, and keys written while one was in flight
+        self._reading: dict[str, int] = {}
+        self._stale: set[str] = set()
+        # Bumped on clear(), so reads started before it are not cached
+        self._generation = 0
+
+    @property
+    def cache_stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses}
+
+    async def get(self, id, fields=None):
+        if fields is not None:
+            return await self.impl.get(id, fields=fields)
+        # Transactions may read uncommitted rows, which must not reach the shared cache
+        if self._in_transaction():
+            return await self.impl.get(id)
+
+        key = self._key(id)
+        entity = await self.backend.get(key)
+        if entity is not None:
+            self.hits += 1
+            return entity
+
+        self.misses += 1
+        generation = self._generation
+        self._begin_read([key])
+        try:
+            entity = await self.impl.get(id)
+        finally:
+            stale = self._end_read([key])
+
+        if entity is not None and not stale and generation == self._generation:
+            await self.backend.set(key, entity)
+        return entity
+
+    async def get_many(self, ids):
+        if self._in_transaction():
+            return await self.impl.get_many(ids)
+
+        ids = list(ids)
+        keys = [self._key(id) for id in ids]
+        found = {}
+        for key in dict.fromkeys(keys):
+            entity = await self.backend.get(key)
+            if entity is not None:
+                found[key] = entity
+
+        self.hits += sum(1 for key in keys if key in found)
+        missing = [id for id, key in zip(ids, keys) if key not in found]
+        self.misses += len(missing)
+
+        if missing:
+            missing_keys = [self._key(id) for id in missing]
+            generation = self._generation
+            self._begin_read(missing_keys)
+            try:
+                entities = await self.impl.get_many(missing)
+            finally:
+                stale = self._end_read(missing_keys)
+
+            for key, entity in zip(missing_keys, entities):
+                if entity is not None:
+                    found[key] = entity
+                    if key not in stale and generation == self._generation:
+                        await self.backend.set(key, entity)
+
+        return [found.get(key) for key in keys]
+
+    async def save(self, entity):
+        result = await self.impl.save(entity)
+        await self._written(self._key(getattr(entity, entity.get_primary_key())))
+        return result
+
+    async def save_batch(self, entities, batch_size=None, concurrency=None):
+        try:
+            return await self.impl.save_batch(entities, batch_size=batch_size, concurrency=concurrency)
+        finally:
+            # Entities may come from a one-shot async iterable, so drop everything
+            await self._written(None)
+
+    async def delete(self, id):
+        result = await self.impl.delete(id)
+        await self._written(self._key(id))
+        return result
+
+    async def get_all(self, fields=None):
+        if fields is None:
+            return await self.impl.get_all()
+        return await self.impl.get_all(fields=fields)
+
+    async def page(self, after=None, limit=None, order_by=None):
+        return await self.impl.page(after=after, limit=limit, order_by=order_by)
+
+    def stream_all(self, chunk_size: int | None = None, fields=None):
+        if fields is None:
+            return self.impl.stream_all(chunk_size)
+        return self.impl.stream_all(chunk_size, fields=fields)
+
+    @staticmethod
+    def _key(id: Any) -> str:
+        return str(id)
+
+    def _in_transaction(self) -> bool:
+        return getattr(self.impl, "in_transaction", False)
+
+    async def _written(self, key: str | None):
+        # None stands for every key
+        invalidate = self._invalidate_all if key is None else functools.partial(self._invalidate, key)
+        await invalidate()
+        # Until the commit other requests still read (and may cache) the previous version
+        if self._in_transaction():
+            self.impl.after_transaction(invalidate)
+
+    def _begin_read(self, keys: list[str]):
+        for key in keys:
+            self._reading[key] = self._reading.get(key, 0) + 1
+
+    def _end_read(self, keys: list[str]) -> set[str]:
+        stale = self._stale.intersection(keys)
+        for key in keys:
+            count = self._reading.pop(key) - 1
+            if count:
+                self._reading[key] = count
+            else:
+                self._stale.discard(key)
+        return stale
+
+    async def _invalidate(self, key: str):
+        # A read already in flight may hold the previous version
+        if key in self._reading:
+            self._stale.add(key)
+        await self.backend.delete(key)
+
+    async def _invalidate_all(self):
+        self._generation += 1
+        await self.backend.clear()
+
+    def __getattr__(self, name):
+        attr = getattr(self.impl, name)
+
+        if name.startswith("delete_by_"):
+            @functools.wraps(attr)
+            async def delete_by(*args, **kwargs):
+                try:
+                    return await attr(*args, **kwargs)
+                finally:
+                    await self._written(None)
+
+            return delete_by
+
+        return attr
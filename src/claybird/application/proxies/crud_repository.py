@@ -2,12 +2,23 @@ import inspect
 import functools
 from typing import Generic, TypeVar, get_origin, get_args
 from claybird.application.ports.outbound.crud_repository_port import CrudRepositoryPort
+from claybird.application.proxies.cached_crud_repository import CachedCrudRepository
+from claybird.application.proxies.write_behind_crud_repository import WriteBehindCrudRepository
 
 T = TypeVar("T")
 
 class CrudRepository(CrudRepositoryPort, Generic[T]):
 
     table_name: str = None
+    # One repository (and engine adapter) per class, shared by every injection site
+    lifetime = "singleton"
+    # e.g. {"max_size": 1000, "ttl": 30} or {"backend": CacheBackendPort()}
+    cache: dict | None = None
+    # e.g. {"flush_size": 1000, "flush_interval": 0.5, "max_size": 10000}
+    write_behind: dict | None = None
+    # "warn", "log" or "ignore" finders on unindexed columns; the engine default when None
+    unindexed_queries: str | None = None
+    lazy_hydration: bool = False
 
     def __init__(self, impl: CrudRepositoryPort):
         entity_cls = self._get_entity_cls()
@@ -15,8 +26,29 @@ class CrudRepository(CrudRepositoryPort, Generic[T]):
             impl.entity_cls = entity_cls
 
         impl.table_name = self.table_name
+        impl.lazy_hydration = self.lazy_hydration
+        if self.unindexed_queries is not None:
+            impl.unindexed_queries = self.unindexed_queries
+
+        if self.write_behind is not None:
+            impl = WriteBehindCrudRepository(impl, **self.write_behind)
+
+        if self.cache is not None:
+            impl = CachedCrudRepository(impl, self._build_cache_backend())
+
         self.impl = impl
 
+    def _build_cache_backend(self):
+        backend = self.cache.get("backend")
+        if backend is not None:
+            return backend
+
+        from claybird.infrastructure.adapters.outbound.cache import MemoryCacheBackend
+        return MemoryCacheBackend(
+            max_size=self.cache.get("max_size", 1024),
+            ttl=self.cache.get("ttl"),
+        )
+
     def _get_entity_cls(self):
         for base in getattr(self.__class__, "__orig_bases__", []):
             origin = get_origin(base)
@@ -32,14 +64,29 @@ class CrudRepository(CrudRepositoryPort, Generic[T]):
     async def delete(self, id):
         return await self.impl.delete(id)
     
-    async def get(self, id):
-        return await self.impl.get(id)
+    async def get(self, id, fields=None):
+        if fields is None:
+            return await self.impl.get(id)
+        return await self.impl.get(id, fields=fields)
     
-    async def get_all(self):
-        return await self.impl.get_all()
+    async def get_many(self, ids):
+        return await self.impl.get_many(ids)
 
-    async def save_batch(self):
-        return await self.impl.save_batch()
+    async def get_all(self, fields=None):
+        if fields is None:
+            return await self.impl.get_all()
+        return await self.impl.get_all(fields=fields)
+
+    async def save_batch(self, entities, batch_size=None, concurrency=None):
+        return await self.impl.save_batch(entities, batch_size=batch_size, concurrency=concurrency)
+
+    async def page(self, after=None, limit=None, order_by=None):
+        return await self.impl.page(after=after, limit=limit, order_by=order_by)
+
+    def stream_all(self, chunk_size: int | None = None, fields=None):
+        if fields is None:
+            return self.impl.stream_all(chunk_size)
+        return self.impl.stream_all(chunk_size, fields=fields)
 
     def __getattr__(self, name):
         attr = getattr(self.impl, name)
@@ -47,12 +94,14 @@ class CrudRepository(CrudRepositoryPort, Generic[T]):
         if not callable(attr):
             return attr
 
-        if inspect.iscoroutinefunction(attr):
-            return attr
-
-        @functools.wraps(attr)
-        async def async_wrapper(*args, **kwargs):
-            result = attr(*args, **kwargs)
-            return result
+        if inspect.iscoroutinefunction(attr) or inspect.isasyncgenfunction(attr):
+            method = attr
+        else:
+            @functools.wraps(attr)
+            async def method(*args, **kwargs):
+                result = attr(*args, **kwargs)
+                return result
 
-        return async_wrapper
+        # Bound methods never change, so skip __getattr__ on the next lookup
+        self.__dict__[name] = method
+        return method
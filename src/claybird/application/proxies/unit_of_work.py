@@ -0,0 +1,11 @@
+from claybird.application.ports.outbound.unit_of_work_port import UnitOfWorkPort
+
+class UnitOfWork(UnitOfWorkPort):
+
+    lifetime = "singleton"
+
+    def __init__(self, impl: UnitOfWorkPort):
+        self.impl = impl
+
+    def transaction(self):
+        return self.impl.transaction()
@@ -0,0 +1,185 @@
+import asyncio
+import contextvars
+import functools
+import inspect
+from typing import Any
+
+from claybird.application.ports.outbound.crud_repository_port import CrudRepositoryPort
+from claybird.infrastructure.adapters.outbound.events import EventBus
+
+
+class WriteBehindCrudRepository(CrudRepositoryPort):
+
+    def __init__(
+        self,
+        impl: CrudRepositoryPort,
+        max_size: int = 10000,
+        flush_size: int = 1000,
+        flush_interval: float = 0.5,
+    ):
+        self.impl = impl
+        self.max_size = max_size
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.last_error: BaseException | None = None
+
+        # Latest entity per primary key, waiting to be written
+        self.buffer: dict[str, Any] = {}
+        # Entities of the batch being written right now
+        self._in_flight: dict[str, Any] = {}
+        self._lock = asyncio.Lock()
+        self._timer: asyncio.Future | None = None
+        self._flush_task: asyncio.Future | None = None
+        self._tasks: set[asyncio.Future] = set()
+
+    @property
+    def pending(self) -> int:
+        return len(self.buffer) + len(self._in_flight)
+
+    @EventBus.on("shutdown")
+    async def _flush_on_shutdown(self):
+        await self.flush()
+
+    async def save(self, entity):
+        key = self._key(getattr(entity, entity.get_primary_key()))
+
+        # Writes inside a transaction must commit or roll back with it
+        if getattr(self.impl, "in_transaction", False):
+            self.buffer.pop(key, None)
+            return await self.impl.save(entity)
+
+        # Backpressure: callers wait for a flush instead of growing the buffer
+        while len(self.buffer) >= self.max_size and key not in self.buffer:
+            await self.flush()
+
+        self.buffer[key] = entity
+
+        if len(self.buffer) >= self.flush_size:
+            if self._flush_task is None or self._flush_task.done():
+                self._flush_task = self._spawn(self._flush_in_background())
+        elif self._timer is None:
+            self._timer = self._spawn(self._flush_later())
+
+    async def flush(self):
+        # Other requests' saves must never run on the caller's transaction connection
+        await self._spawn(self._drain())
+
+    async def _drain(self):
+        async with self._lock:
+            if not self.buffer:
+                return
+
+            batch, self.buffer = self.buffer, {}
+            self._in_flight = batch
+            try:
+                await self.impl.save_batch(list(batch.values()))
+            except BaseException:
+                # Put the batch back, unless a newer save replaced an entity meanwhile
+                self.buffer = {**batch, **self.buffer}
+                raise
+            finally:
+                self._in_flight = {}
+
+    async def _flush_in_background(self):
+        try:
+            await self._drain()
+            self.last_error = None
+        except Exception as e:
+            self.last_error = e
+
+    async def _flush_later(self):
+        try:
+            await asyncio.sleep(self.flush_interval)
+            await self._flush_in_background()
+        finally:
+            self._timer = None
+            # Whatever is left (saves during the flush or a failed batch) gets another turn
+            if self.buffer:
+                self._timer = self._spawn(self._flush_later())
+
+    def _spawn(self, coro) -> asyncio.Future:
+        # A fresh context, so writes never join the caller's transaction
+        task = contextvars.Context().run(asyncio.ensure_future, coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _buffered(self, id: Any):
+        key = self._key(id)
+        entity = self.buffer.get(key)
+        return entity if entity is not None else self._in_flight.get(key)
+
+    async def get(self, id, fields=None):
+        entity = self._buffered(id)
+        if entity is not None and fields is None:
+            return entity
+
+        if entity is not None:
+            await self.flush()
+        if fields is None:
+            return await self.impl.get(id)
+        return await self.impl.get(id, fields=fields)
+
+    async def get_many(self, ids):
+        ids = list(ids)
+        found = {self._key(id): entity for id in ids if (entity := self._buffered(id)) is not None}
+        missing = [id for id in ids if self._key(id) not in found]
+
+        if missing:
+            for id, entity in zip(missing, await self.impl.get_many(missing)):
+                found[self._key(id)] = entity
+
+        return [found.get(self._key(id)) for id in ids]
+
+    async def save_batch(self, entities, batch_size=None, concurrency=None):
+        await self.flush()
+        return await self.impl.save_batch(entities, batch_size=batch_size, concurrency=concurrency)
+
+    async def delete(self, id):
+        # Holding the lock keeps an in-flight flush from re-inserting the row afterwards
+        async with self._lock:
+            self.buffer.pop(self._key(id), None)
+            return await self.impl.delete(id)
+
+    async def get_all(self, fields=None):
+        await self.flush()
+        if fields is None:
+            return await self.impl.get_all()
+        return await self.impl.get_all(fields=fields)
+
+    async def page(self, after=None, limit=None, order_by=None):
+        await self.flush()
+        return await self.impl.page(after=after, limit=limit, order_by=order_by)
+
+    async def stream_all(self, chunk_size: int | None = None, fields=None):
+        await self.flush()
+        stream = self.impl.stream_all(chunk_size) if fields is None else self.impl.stream_all(chunk_size, fields=fields)
+        async for item in stream:
+            yield item
+
+    @staticmethod
+    def _key(id: Any) -> str:
+        return str(id)
+
+    def __getattr__(self, name):
+        attr = getattr(self.impl, name)
+
+        # Queries must see buffered saves, so flush before running them
+        if inspect.isasyncgenfunction(attr):
+            @functools.wraps(attr)
+            async def stream(*args, **kwargs):
+                await self.flush()
+                async for item in attr(*args, **kwargs):
+                    yield item
+
+            return stream
+
+        if inspect.iscoroutinefunction(attr):
+            @functools.wraps(attr)
+            async def query(*args, **kwargs):
+                await self.flush()
+                return await attr(*args, **kwargs)
+
+            return query
+
+        return attr
@@ -1,2 +1,3 @@
 from .entity import Entity
-from .field import field, Field
\ No newline at end of file
+from .field import field, Field
+from .index import index, Index
@@ -1,6 +1,35 @@
 from claybird.domain.entities.field import Field
+from claybird.domain.entities.index import Index
+
+
+def iter_fields(self):
+    for name in self.get_keys():
+        yield name, getattr(self, name)
+
+
+class EntityMeta(type):
+
+    def __new__(mcs, name, bases, namespace, slots: bool = False, **kwargs):
+        if slots:
+            fields = [key for key, value in namespace.items() if isinstance(value, Field)]
+            namespace["__slots__"] = tuple(f"_slot_{key}" for key in fields)
+            namespace["_slotted"] = True
+            # Without __dict__, encoders such as FastAPI's fall back to dict(entity)
+            namespace.setdefault("__iter__", iter_fields)
+
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+
+        if slots:
+            for key in fields:
+                cls._meta["fields"][key].slot = cls.__dict__[f"_slot_{key}"]
+
+        return cls
+
+
+class Entity(metaclass=EntityMeta):
+    __slots__ = ()
+    _slotted = False
 
-class Entity:
     def __init__(self, **kwargs):
         for name, field in self._meta["fields"].items():
             if name in kwargs:
@@ -13,7 +42,32 @@ class Entity:
                 value = field.get_default(self)
 
             field.validate_type(value)
-            setattr(self, name, value)
+            field.store(self, value)
+
+    @classmethod
+    def from_trusted(cls, **values):
+        instance = cls.__new__(cls)
+        fields = cls._meta["fields"]
+
+        if cls._slotted:
+            for name, field in fields.items():
+                field.store(instance, values[name] if name in values else field.get_default(instance))
+            return instance
+
+        data = instance.__dict__
+        data.update(values)
+
+        if len(values) < len(fields):
+            for name, field in fields.items():
+                if name not in data:
+                    data[name] = field.get_default(instance)
+
+        return instance
+
+    @classmethod
+    def from_trusted_many(cls, rows) -> list:
+        from_trusted = cls.from_trusted
+        return [from_trusted(**row) for row in rows]
 
     def to_dict(self) -> dict:
         result = {}
@@ -39,6 +93,16 @@ class Entity:
     def get_fields(cls):
         return cls._meta["fields"]
 
+    @classmethod
+    def get_indexes(cls) -> dict[str, Index]:
+        indexes = {
+            name: Index(name, unique=field.unique)
+            for name, field in cls._meta["fields"].items()
+            if (field.index or field.unique) and not field.primary_key
+        }
+        indexes.update(cls._meta.get("indexes", {}))
+        return indexes
+
     @classmethod
     def get_primary_key(cls):
         return cls._meta["primary_key"]
@@ -3,14 +3,18 @@ from claybird.domain.entities.field_type import FieldType
 from uuid import UUID
 
 class Field:
-    __slots__ = ("type_", "required", "default", "primary_key", "name")
+    __slots__ = ("type_", "required", "default", "primary_key", "index", "unique", "name", "slot", "_default_arity")
 
-    def __init__(self, *, type_=str, required=False, default=None, primary_key=False):
+    def __init__(self, *, type_=str, required=False, default=None, primary_key=False, index=False, unique=False):
         self.type_ = type_
         self.required = required
         self.default = default
         self.primary_key = primary_key
+        self.index = index
+        self.unique = unique
         self.name = None
+        self.slot = None
+        self._default_arity = None
 
     def __set_name__(self, owner, name):
         self.name = name
@@ -29,18 +33,21 @@ class Field:
 
     def get_default(self, instance):
         if callable(self.default):
-            sig = inspect.signature(self.default)
-            if len(sig.parameters) == 0:
-                return self.default()
-            elif len(sig.parameters) == 1:
-                return self.default(instance)
-            else:
-                raise TypeError(
-                    f"Default function for '{self.name}' must accept 0 or 1 argument"
-                )
+            arity = self._default_arity
+            if arity is None:
+                arity = self._default_arity = self._resolve_default_arity()
+            return self.default() if arity == 0 else self.default(instance)
 
         return self.default
 
+    def _resolve_default_arity(self) -> int:
+        sig = inspect.signature(self.default)
+        if len(sig.parameters) > 1:
+            raise TypeError(
+                f"Default function for '{self.name}' must accept 0 or 1 argument"
+            )
+        return len(sig.parameters)
+
     def validate_type(self, value):
         if value is None:
             return
@@ -63,17 +70,29 @@ class Field:
         if instance is None:
             return self
 
-        if self.name in instance.__dict__:
-            return instance.__dict__[self.name]
+        if self.slot is None:
+            if self.name in instance.__dict__:
+                return instance.__dict__[self.name]
+        else:
+            try:
+                return self.slot.__get__(instance, owner)
+            except AttributeError:
+                pass
 
         value = self.get_default(instance)
         self.validate_type(value)
-        instance.__dict__[self.name] = value
+        self.store(instance, value)
         return value
 
     def __set__(self, instance, value):
         self.validate_type(value)
-        instance.__dict__[self.name] = value
+        self.store(instance, value)
+
+    def store(self, instance, value):
+        if self.slot is None:
+            instance.__dict__[self.name] = value
+        else:
+            self.slot.__set__(instance, value)
 
 
 def field(**kwargs):
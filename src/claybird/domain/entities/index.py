@@ -0,0 +1,22 @@
+class Index:
+    __slots__ = ("columns", "unique", "name")
+
+    def __init__(self, *columns: str, unique: bool = False):
+        if not columns:
+            raise ValueError("An index needs at least one column")
+
+        self.columns = columns
+        self.unique = unique
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+        if not hasattr(owner, "_meta"):
+            owner._meta = {"fields": {}, "primary_key": None}
+
+        owner._meta.setdefault("indexes", {})[name] = self
+
+
+def index(*columns: str, unique: bool = False):
+    return Index(*columns, unique=unique)
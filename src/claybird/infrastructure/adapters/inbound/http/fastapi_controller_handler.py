@@ -1,6 +1,7 @@
 from claybird.application.ports.inbound.controller_handler_port import ControllerHandlerPort
 from claybird.infrastructure.adapters.inbound.http.routing.mapping_info import MappingInfo
 from claybird.infrastructure.adapters.inbound.http.routing.controller import Controller
+from claybird.infrastructure.adapters.inbound.http.request_scope_middleware import RequestScopeMiddleware
 from fastapi import FastAPI, APIRouter
 
 class FastAPIControllerHandler(ControllerHandlerPort):
@@ -16,6 +17,9 @@ class FastAPIControllerHandler(ControllerHandlerPort):
     ):
         self.app = FastAPI(debug=debug, title=title, summary=summary, description=description, version=version, openapi_url=openapi_url)
 
+    def use_request_scope(self, open_scope):
+        self.app.add_middleware(RequestScopeMiddleware, open_scope=open_scope)
+
     def get_controllers(self):
         return Controller.controllers
 
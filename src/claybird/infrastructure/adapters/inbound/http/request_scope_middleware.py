@@ -0,0 +1,13 @@
+class RequestScopeMiddleware:
+
+    # Plain ASGI middleware, cheaper than BaseHTTPMiddleware and safe for streaming responses
+    def __init__(self, app, open_scope):
+        self.app = app
+        self.open_scope = open_scope
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] not in ("http", "websocket"):
+            return await self.app(scope, receive, send)
+
+        async with self.open_scope():
+            await self.app(scope, receive, send)
@@ -0,0 +1 @@
+from .memory_cache_backend import MemoryCacheBackend
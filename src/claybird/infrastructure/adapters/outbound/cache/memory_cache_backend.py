@@ -0,0 +1,42 @@
+import time
+from collections import OrderedDict
+
+from claybird.application.ports.outbound.cache_backend_port import CacheBackendPort
+
+
+class MemoryCacheBackend(CacheBackendPort):
+
+    def __init__(self, max_size: int = 1024, ttl: float | None = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries: OrderedDict = OrderedDict()
+
+    async def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.entries[key]
+            return None
+
+        self.entries.move_to_end(key)
+        return value
+
+    async def set(self, key, value):
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        self.entries[key] = (expires_at, value)
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    async def delete(self, key):
+        self.entries.pop(key, None)
+
+    async def clear(self):
+        self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
@@ -1,92 +1,248 @@
+import asyncio
 import inspect
 from typing import Any
 
 from claybird.application.ports.outbound.dependency_injector_port import DependencyInjectorPort
 from claybird.application.ports.outbound.dependency_container_port import DependencyContainerPort
 from claybird.application.ports.outbound.crud_repository_port import CrudRepositoryPort
-
+from claybird.application.ports.outbound.unit_of_work_port import UnitOfWorkPort
+
+from claybird.infrastructure.adapters.outbound.dependencies.resolution_plan import (
+    SCOPED,
+    SINGLETON,
+    TRANSIENT,
+    Dependency,
+    ResolutionPlan,
+)
+from claybird.infrastructure.adapters.outbound.dependencies.scope import Scope, ScopedProxy, current_scope
 from claybird.infrastructure.factories.connection_handler_factory import ConnectionHandlerFactory
 
 
+class DependencyCycleError(Exception):
+
+    def __init__(self, chain: list[str]):
+        self.chain = chain
+        super().__init__(f"Dependency cycle: {' -> '.join(chain)}")
+
+
 class DependencyInjector(DependencyInjectorPort):
 
+    ENGINE_PORTS = (CrudRepositoryPort, UnitOfWorkPort)
+
     def __init__(self, container: DependencyContainerPort):
         self.container = container
         self.connection_handler_factory = ConnectionHandlerFactory(container)
+        self._plans: dict[Any, ResolutionPlan] = {}
+        self._singletons: dict[type, Any] = {}
+        # (connection, port, owner) -> engine adapter
+        self._engine_adapters: dict[tuple, Any] = {}
+        # Engine adapters being created, shared by every plan that needs them
+        self._loading: dict[tuple, asyncio.Future] = {}
+        # Plan -> engine adapter keys it needs, directly or through its dependencies
+        self._required: dict[Any, frozenset] = {}
+        # Plans being compiled: key -> position in the resolution path
+        self._resolving: dict[Any, int] = {}
+        # [target, lifetime, edge to the next entry]
+        self._path: list[list] = []
+        self._proxies: dict[Any, ScopedProxy] = {}
+
+    def request_scope(self) -> Scope:
+        return Scope()
 
     async def inject(self, target: Any):
-        instance = await self._inject_on_constructor(target)
-        return await self._inject_on_attrs(instance)
+        # Outside of a request scope, scoped dependencies are injected as proxies
+        scope = current_scope.get()
 
-    async def _inject_on_constructor(self, target: Any):
         if not inspect.isclass(target):
-            return target
-
-        signature = inspect.signature(target.__init__)
-        kwargs = {}
-
-        for name, param in signature.parameters.items():
-            if name == "self":
+            attributes = self._compile_attributes(target, getattr(target, "__annotations__", {}))
+            if self._loading:
+                await self._ready(self._required_adapters(attributes))
+            return self._inject_attributes(target, attributes, scope)
+
+        plan = self._plan(target)
+        if self._loading:
+            required = self._required.get(plan)
+            if required is None:
+                required = self._required[plan] = self._required_adapters(plan.arguments + plan.attributes)
+            await self._ready(required)
+        return self._build(plan, scope)
+
+    async def _ready(self, required: frozenset):
+        # Compiling is synchronous, the engine adapters it asked for load concurrently.
+        # Failed loads stay in _loading and only fail the plans that need them
+        pending = [self._loading[key] for key in required if key in self._loading]
+        if pending:
+            await asyncio.gather(*pending)
+
+    def _required_adapters(self, dependencies: list[Dependency]) -> frozenset:
+        keys = set()
+        seen = set()
+        stack = list(dependencies)
+        while stack:
+            dependency = stack.pop()
+            if dependency.kind == "adapter":
+                keys.add(dependency.value)
                 continue
-
-            port = param.annotation
-            if port is inspect.Parameter.empty:
+            if dependency.kind == "value":
                 continue
 
-            # Repository injection (special case)
-            if self._is_repository(port):
-                kwargs[name] = await self._handle_repository(target, port)
+            plan = dependency.value if dependency.kind == "plan" else self._plans[dependency.value]
+            if plan not in seen:
+                seen.add(plan)
+                stack.extend(plan.arguments)
+                stack.extend(plan.attributes)
+        return frozenset(keys)
+
+    def _plan(self, target: Any, lifetime: str | None = None) -> ResolutionPlan | Dependency:
+        key = target if lifetime is None else (target, lifetime)
+        plan = self._plans.get(key)
+        if plan is not None:
+            return plan
+
+        if key in self._resolving:
+            return self._cycle(key)
+
+        self._resolving[key] = len(self._path)
+        self._path.append([target, lifetime or getattr(target, "lifetime", TRANSIENT), None])
+        try:
+            plan = self._plans[key] = self._compile(target, lifetime)
+        finally:
+            del self._resolving[key]
+            self._path.pop()
+        return plan
+
+    def _cycle(self, key: Any) -> Dependency:
+        cycle = self._path[self._resolving[key]:]
+
+        # Instances cached before attribute injection can be referenced back from their attributes
+        if any(lifetime != TRANSIENT and edge[0] == "attribute" for _, lifetime, edge in cycle):
+            return Dependency(None, "ref", key)
+
+        chain = [
+            f"{target.__name__}.__init__({name})" if kind == "argument" else f"{target.__name__}.{name}"
+            for target, _, (kind, name) in cycle
+        ]
+        raise DependencyCycleError(chain + [cycle[0][0].__name__])
+
+    def _compile(self, target: type, lifetime: str | None = None) -> ResolutionPlan:
+        arguments = []
+        for name, param in inspect.signature(target.__init__).parameters.items():
+            if name == "self" or param.annotation is inspect.Parameter.empty:
                 continue
 
-            # Registered dependency
-            if self.container.has(port):
-                adapter = self.container.get(port)
-                kwargs[name] = await self._resolve(adapter)
+            port = param.annotation
+            # Engine adapter injection: repositories and units of work (special case)
+            if self._is_engine_port(port):
+                arguments.append(self._engine_adapter(name, target, port))
             else:
-                # Recursive resolution
-                kwargs[name] = await self.inject(port)
+                self._path[-1][2] = ("argument", name)
+                arguments.append(self._dependency(name, port))
 
-        return target(**kwargs)
+        attributes = self._compile_attributes(target, getattr(target, "__annotations__", {}))
 
-    async def _inject_on_attrs(self, target: Any):
-        annotations = getattr(target, "__annotations__", {})
+        return ResolutionPlan(target, lifetime or getattr(target, "lifetime", TRANSIENT), arguments, attributes)
 
-        for attr_name, port in annotations.items():
-            if hasattr(target, attr_name):
+    def _compile_attributes(self, target: Any, annotations: dict) -> list[Dependency]:
+        attributes = []
+        for name, port in annotations.items():
+            if hasattr(target, name):
                 continue
-
-            if self.container.has(port):
-                adapter = self.container.get(port)
-                value = await self._resolve(adapter)
-            else:
-                value = await self.inject(port)
-
-            setattr(target, attr_name, value)
-
-        return target
-
-    async def _resolve(self, adapter: Any):
-        if inspect.isclass(adapter):
-            return await self.inject(adapter)
-
-        if callable(adapter):
-            return adapter()
-
-        return adapter
-
-    def _is_repository(self, annotation: Any) -> bool:
-        return (
-            inspect.isclass(annotation)
-            and issubclass(annotation, CrudRepositoryPort)
-        )
-
-    async def _handle_repository(self, target: Any, port: type):
-        connection_name = getattr(target, "connection", "default")
-
+            if self._path:
+                self._path[-1][2] = ("attribute", name)
+            attributes.append(self._dependency(name, port))
+        return attributes
+
+    def _dependency(self, name: str, port: Any) -> Dependency:
+        # Registered dependency
+        if self.container.has(port):
+            adapter = self.container.get(port)
+            lifetime = self.container.get_lifetime(port)
+            if inspect.isclass(adapter):
+                return self._plan_dependency(name, adapter, lifetime)
+            if callable(adapter):
+                # Factories are plans without arguments
+                return Dependency(name, "plan", ResolutionPlan(adapter, lifetime or TRANSIENT, [], []))
+            return Dependency(name, "value", adapter)
+
+        # Recursive resolution
+        if inspect.isclass(port):
+            return self._plan_dependency(name, port)
+        return Dependency(name, "value", port)
+
+    def _plan_dependency(self, name: str, target: type, lifetime: str | None = None) -> Dependency:
+        plan = self._plan(target, lifetime)
+        if isinstance(plan, Dependency):
+            return plan._replace(name=name)
+        return Dependency(name, "plan", plan)
+
+    def _build(self, plan: ResolutionPlan, scope: Scope | None):
+        if plan.lifetime == SINGLETON:
+            cache = self._singletons
+            # A singleton outlives any request, so it only gets proxies to scoped dependencies
+            scope = None
+        elif plan.lifetime == SCOPED:
+            if scope is None:
+                return self._proxy(plan)
+            if scope.closed:
+                raise RuntimeError("Scoped dependency used after its request scope ended")
+            cache = scope.instances
+        else:
+            cache = None
+
+        if cache is not None:
+            instance = cache.get(plan.target)
+            if instance is not None:
+                return instance
+
+        instance = plan.target(**{
+            dependency.name: self._value(dependency, scope)
+            for dependency in plan.arguments
+        })
+        # Cached before attribute injection so attributes may point back to it
+        if cache is not None:
+            cache[plan.target] = instance
+            if cache is not self._singletons:
+                scope.track(instance)
+
+        return self._inject_attributes(instance, plan.attributes, scope)
+
+    def _inject_attributes(self, instance: Any, attributes: list[Dependency], scope: Scope | None):
+        for dependency in attributes:
+            if not hasattr(instance, dependency.name):
+                setattr(instance, dependency.name, self._value(dependency, scope))
+        return instance
+
+    def _value(self, dependency: Dependency, scope: Scope | None):
+        if dependency.kind == "plan":
+            return self._build(dependency.value, scope)
+        if dependency.kind == "value":
+            return dependency.value
+        if dependency.kind == "adapter":
+            return self._engine_adapters[dependency.value]
+        # Back reference inside a cycle, published once the whole cycle compiled
+        return self._build(self._plans[dependency.value], scope)
+
+    def _proxy(self, plan: ResolutionPlan) -> ScopedProxy:
+        proxy = self._proxies.get(plan.target)
+        if proxy is None:
+            proxy = self._proxies[plan.target] = ScopedProxy(lambda scope: self._build(plan, scope))
+        return proxy
+
+    def _is_engine_port(self, annotation: Any) -> bool:
+        return annotation in self.ENGINE_PORTS
+
+    def _engine_adapter(self, name: str, target: Any, port: type) -> Dependency:
+        key = (getattr(target, "connection", "default"), port, target)
+        if key not in self._engine_adapters and key not in self._loading:
+            task = self._loading[key] = asyncio.ensure_future(self._load_engine_adapter(key))
+            # The error is reported by the injections that need the adapter, if any
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+        return Dependency(name, "adapter", key)
+
+    async def _load_engine_adapter(self, key: tuple):
+        connection_name, port, _ = key
         connection = self.container.get(f"{connection_name}_connection")
-
-        handler = self.connection_handler_factory.get_handler(
-            connection["engine"]
-        )
-
-        return await handler.get_engine_adapter(connection, port)
\ No newline at end of file
+        handler = self.connection_handler_factory.get_handler(connection["engine"])
+        self._engine_adapters[key] = await handler.get_engine_adapter(connection, port)
+        # Failed loads stay in place so every injection needing them reports the error
+        del self._loading[key]
@@ -4,9 +4,14 @@ class DictDependencyContainer(DependencyContainerPort):
 
     def __init__(self):
         self.dependencies = {}
+        self.lifetimes = {}
 
-    def register(self, key, dependency):
+    def register(self, key, dependency, lifetime: str | None = None):
         self.dependencies[key] = dependency
+        if lifetime is None:
+            self.lifetimes.pop(key, None)
+        else:
+            self.lifetimes[key] = lifetime
 
     def get(self, key):
         if (key not in self.dependencies):
@@ -14,4 +19,7 @@ class DictDependencyContainer(DependencyContainerPort):
         return self.dependencies[key]
     
     def has(self, key):
-        return key in self.dependencies
\ No newline at end of file
+        return key in self.dependencies
+
+    def get_lifetime(self, key):
+        return self.lifetimes.get(key)
\ No newline at end of file
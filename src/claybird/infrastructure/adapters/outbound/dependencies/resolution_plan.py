@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import Any, NamedTuple
+
+SINGLETON = "singleton"
+SCOPED = "scoped"
+TRANSIENT = "transient"
+LIFETIMES = (SINGLETON, SCOPED, TRANSIENT)
+
+
+class Dependency(NamedTuple):
+    name: str
+    # "value" is used as is, "plan" is built, "adapter" and "ref" are looked up by key
+    kind: str
+    value: Any
+
+
+class ResolutionPlan:
+    __slots__ = ("target", "lifetime", "arguments", "attributes")
+
+    def __init__(self, target: Any, lifetime: str, arguments: list[Dependency], attributes: list[Dependency]):
+        if lifetime not in LIFETIMES:
+            raise ValueError(f"Unknown lifetime '{lifetime}' for {getattr(target, '__name__', target)}")
+
+        self.target = target
+        self.lifetime = lifetime
+        self.arguments = arguments
+        self.attributes = attributes
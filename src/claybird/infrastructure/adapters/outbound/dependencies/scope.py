@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import inspect
+from contextvars import ContextVar
+from typing import Any
+
+current_scope: ContextVar[Scope | None] = ContextVar("claybird_request_scope", default=None)
+
+
+class Scope:
+    __slots__ = ("instances", "closed", "_disposables", "_token")
+
+    def __init__(self):
+        self.instances: dict[Any, Any] = {}
+        # Contexts copied into background tasks may outlive the request
+        self.closed = False
+        self._disposables: list[Any] = []
+        self._token = None
+
+    def track(self, instance: Any):
+        if hasattr(instance, "aclose") or hasattr(instance, "close"):
+            self._disposables.append(instance)
+
+    async def __aenter__(self) -> Scope:
+        self._token = current_scope.set(self)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        current_scope.reset(self._token)
+        self._token = None
+        self.closed = True
+        await self.dispose()
+
+    async def dispose(self):
+        disposables, self._disposables = self._disposables, []
+        self.instances.clear()
+
+        # Last created first, like nested context managers
+        for instance in reversed(disposables):
+            close = getattr(instance, "aclose", None) or instance.close
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+
+
+class ScopedProxy:
+    __slots__ = ("_resolve",)
+
+    def __init__(self, resolve):
+        # resolve(scope) returns the instance for that scope
+        object.__setattr__(self, "_resolve", resolve)
+
+    def _instance(self):
+        scope = current_scope.get()
+        if scope is None:
+            raise RuntimeError("Scoped dependency used outside of a request scope")
+        return self._resolve(scope)
+
+    def __getattr__(self, name: str):
+        return getattr(self._instance(), name)
+
+    def __setattr__(self, name: str, value: Any):
+        setattr(self._instance(), name, value)
+
+    # Special methods are looked up on the type, so they are forwarded one by one
+
+    @property
+    def __class__(self):
+        # isinstance() checks see the scoped instance while a scope is active
+        if current_scope.get() is None:
+            return ScopedProxy
+        return type(self._instance())
+
+    def __repr__(self):
+        if current_scope.get() is None:
+            return f"<ScopedProxy {self._resolve}>"
+        return repr(self._instance())
+
+    def __str__(self):
+        return str(self._instance())
+
+    def __bool__(self):
+        return bool(self._instance())
+
+    def __len__(self):
+        return len(self._instance())
+
+    def __iter__(self):
+        return iter(self._instance())
+
+    def __contains__(self, item):
+        return item in self._instance()
+
+    def __getitem__(self, key):
+        return self._instance()[key]
+
+    def __setitem__(self, key, value):
+        self._instance()[key] = value
+
+    def __delitem__(self, key):
+        del self._instance()[key]
+
+    def __call__(self, *args, **kwargs):
+        return self._instance()(*args, **kwargs)
+
+    def __aiter__(self):
+        return self._instance().__aiter__()
+
+    def __enter__(self):
+        return self._instance().__enter__()
+
+    def __exit__(self, *exc_info):
+        return self._instance().__exit__(*exc_info)
+
+    def __aenter__(self):
+        return self._instance().__aenter__()
+
+    def __aexit__(self, *exc_info):
+        return self._instance().__aexit__(*exc_info)
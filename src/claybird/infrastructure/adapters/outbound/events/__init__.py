@@ -1 +1 @@
-from .event_bus import EventBus
\ No newline at end of file
+from .event_bus import EventBus, EventDispatchError
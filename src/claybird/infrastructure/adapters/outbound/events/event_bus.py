@@ -1,5 +1,21 @@
 from claybird.application.ports.outbound.event_bus_port import EventBusPort
+import asyncio
 import inspect
+import itertools
+import logging
+import weakref
+
+logger = logging.getLogger(__name__)
+
+
+class EventDispatchError(Exception):
+
+    def __init__(self, event_name, errors):
+        self.event_name = event_name
+        self.errors = errors
+        details = "; ".join(f"{type(e).__name__}: {e}" for e in errors)
+        super().__init__(f"{len(errors)} handler(s) failed for '{event_name}': {details}")
+
 
 class EventDescriptor:
 
@@ -9,8 +25,9 @@ class EventDescriptor:
 
     def __set_name__(self, owner, name):
         EventBus.handlers.setdefault(self.event_name, []).append((owner, name))
+        EventBus._class_handlers.clear()
 
-        if not hasattr(owner, "_event_init_wrapped"):
+        if "_event_init_wrapped" not in owner.__dict__:
             self.wrap_init(owner)
             owner._event_init_wrapped = True
 
@@ -29,7 +46,14 @@ class EventDescriptor:
 
 class EventBus(EventBusPort):
     handlers = {}
+    # event -> {instance: registration order}, instances weakly held
     instances = {}
+    # Handlers running at once per emit, None for no limit
+    concurrency = 16
+
+    _class_handlers = {}
+    _sequence = itertools.count()
+    _background = set()
 
     @classmethod
     def on(cls, event_name: str):
@@ -39,16 +63,89 @@ class EventBus(EventBusPort):
 
     @classmethod
     def register_instance(cls, instance):
-        cls.instances.setdefault(type(instance), []).append(instance)
+        order = next(cls._sequence)
+        for event_name in cls._handlers_for(type(instance)):
+            listeners = cls.instances.setdefault(event_name, weakref.WeakKeyDictionary())
+            listeners.setdefault(instance, order)
+
+    @classmethod
+    def listeners(cls, event_name) -> list:
+        # In registration order
+        return list(cls.instances.get(event_name, {}).keys())
+
+    @classmethod
+    def _handlers_for(cls, instance_cls):
+        # Handlers declared anywhere in the MRO apply to subclasses as well
+        handlers = cls._class_handlers.get(instance_cls)
+        if handlers is None:
+            handlers = {}
+            for event_name, owners in cls.handlers.items():
+                names = []
+                for owner, name in owners:
+                    if issubclass(instance_cls, owner) and name not in names:
+                        names.append(name)
+                if names:
+                    handlers[event_name] = tuple(names)
+            cls._class_handlers[instance_cls] = handlers
+        return handlers
+
+    @classmethod
+    def _calls(cls, event_name, ordered: bool = False):
+        listeners = cls.instances.get(event_name)
+        if not listeners:
+            return []
+
+        # Strong references for the duration of the dispatch
+        registered = list(listeners.items())
+        if ordered:
+            registered.sort(key=lambda item: item[1])
+
+        return [
+            getattr(instance, name)
+            for instance, _ in registered
+            for name in cls._handlers_for(type(instance))[event_name]
+        ]
+
+    @staticmethod
+    async def _call(method, args, kwargs):
+        result = method(*args, **kwargs)
+        if inspect.isawaitable(result):
+            await result
 
     @classmethod
     async def emit(cls, event_name, *args, **kwargs):
-        for owner_cls, func_name in cls.handlers.get(event_name, []):
-            for instance in cls.instances.get(owner_cls, []):
-                method = getattr(instance, func_name)
+        calls = cls._calls(event_name)
+        if not calls:
+            return
+
+        semaphore = asyncio.Semaphore(cls.concurrency) if cls.concurrency else None
+
+        async def run(method):
+            if semaphore is None:
+                return await cls._call(method, args, kwargs)
+            async with semaphore:
+                return await cls._call(method, args, kwargs)
 
-                if inspect.iscoroutinefunction(method):
-                    await method(*args, **kwargs)
-                else:
-                    method(*args, **kwargs)
+        results = await asyncio.gather(*(run(method) for method in calls), return_exceptions=True)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            raise EventDispatchError(event_name, errors)
 
+    @classmethod
+    async def emit_ordered(cls, event_name, *args, **kwargs):
+        # One handler at a time, in instance registration order
+        for method in cls._calls(event_name, ordered=True):
+            await cls._call(method, args, kwargs)
+
+    @classmethod
+    def emit_nowait(cls, event_name, *args, **kwargs) -> asyncio.Task:
+        task = asyncio.ensure_future(cls.emit(event_name, *args, **kwargs))
+        cls._background.add(task)
+        task.add_done_callback(cls._finish_background)
+        return task
+
+    @classmethod
+    def _finish_background(cls, task):
+        cls._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Background event dispatch failed", exc_info=task.exception())
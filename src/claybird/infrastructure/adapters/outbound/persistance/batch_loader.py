@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable
+
+
+class BatchLoader:
+
+    def __init__(
+        self,
+        load_many: Callable[[list], Awaitable[list]],
+        load_one: Callable[[Any], Awaitable[Any]] | None = None,
+    ):
+        self.load_many = load_many
+        self.load_one = load_one
+        self.pending: dict[Any, list[asyncio.Future]] = {}
+        # Strong references, the loop only keeps weak ones to its tasks
+        self.running: set[asyncio.Task] = set()
+
+    async def load(self, key: Any):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        if not self.pending:
+            # Every load() issued before the loop gets back to this callback
+            # lands in the same batch
+            loop.call_soon(self._dispatch)
+
+        self.pending.setdefault(key, []).append(future)
+        return await future
+
+    def _dispatch(self):
+        batch, self.pending = self.pending, {}
+        task = asyncio.ensure_future(self._resolve(batch))
+        self.running.add(task)
+        task.add_done_callback(self.running.discard)
+
+    async def _resolve(self, batch: dict[Any, list[asyncio.Future]]):
+        keys = list(batch)
+
+        try:
+            if len(keys) == 1 and self.load_one is not None:
+                results = [await self.load_one(keys[0])]
+            else:
+                results = await self.load_many(keys)
+        except BaseException as e:
+            # A cancelled load must not leave its waiters pending forever
+            cancelled = isinstance(e, asyncio.CancelledError)
+            for futures in batch.values():
+                for future in futures:
+                    if future.done():
+                        continue
+                    if cancelled:
+                        future.cancel()
+                    else:
+                        future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        for key, result in zip(keys, results):
+            for future in batch[key]:
+                if not future.done():
+                    future.set_result(result)
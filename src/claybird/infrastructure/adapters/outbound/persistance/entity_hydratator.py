@@ -0,0 +1,214 @@
+import itertools
+from typing import Any, Callable, Type, Dict, NamedTuple
+from dataclasses import is_dataclass
+from pydantic import BaseModel
+from claybird.domain.entities import Entity, Field
+from claybird.infrastructure.adapters.outbound.persistance.entity_view import build_entity_view
+
+
+class CompiledHydration(NamedTuple):
+    hydrate: Callable[[dict], Any]
+    deshydrate: Callable[[Any], Dict[str, Any]]
+    columns: tuple
+    # Top-level field name -> function decoding that field from a row
+    readers: Dict[str, Callable[[dict], Any]]
+
+
+class EntityHydratator:
+
+    _compiled: Dict[type, CompiledHydration] = {}
+    _views: Dict[type, type] = {}
+
+    def __init__(self, entity_cls):
+        self.entity_cls = entity_cls
+
+    def deshydrate(self, entity: Any, prefix: str = "") -> Dict[str, Any]:
+        if prefix or (type(entity) is not self.entity_cls and type(entity) is not self._views.get(self.entity_cls)):
+            return self.reflective_deshydrate(entity, prefix)
+        return self.compiled.deshydrate(entity)
+
+    def hydrate(self, data: dict, target_cls=None, prefix="") -> Entity:
+        if target_cls is not None or prefix:
+            return self.reflective_hydrate(data, target_cls, prefix)
+        return self.compiled.hydrate(data)
+
+    def hydrate_lazy(self, data: dict) -> Entity:
+        return self.view_cls.from_row(data)
+
+    @property
+    def view_cls(self) -> type:
+        view_cls = self._views.get(self.entity_cls)
+        if view_cls is None:
+            view_cls = self._views[self.entity_cls] = build_entity_view(self.entity_cls, self.compiled.readers)
+        return view_cls
+
+    @property
+    def columns(self) -> tuple:
+        return self.compiled.columns
+
+    @property
+    def compiled(self) -> CompiledHydration:
+        compiled = self._compiled.get(self.entity_cls)
+        if compiled is None:
+            compiled = self._compiled[self.entity_cls] = self._compile(self.entity_cls)
+        return compiled
+
+    def reflective_deshydrate(self, entity: Any, prefix: str = "") -> Dict[str, Any]:
+        result = {}
+
+        fields = (
+            entity.get_fields()
+            if hasattr(entity, "get_fields")
+            else self.get_embedded_fields(type(entity))
+        )
+
+        for name, field in fields.items():
+            value = getattr(entity, name)
+            key = f"{prefix}{name}"
+            field_type = field.type_ if hasattr(field, "type_") else type(value)
+
+            if value is None:
+                if isinstance(field, Field) and self.is_embedded_type(field_type):
+                    result.update(dict.fromkeys(self._column_keys(field_type, f"{key}_"), None))
+                else:
+                    result[key] = None
+                continue
+
+            if self.is_embedded_type(field_type):
+                nested = self.reflective_deshydrate(value, prefix=f"{key}_")
+                result.update(nested)
+            else:
+                result[key] = value
+
+        return result
+
+    def reflective_hydrate(self, data: dict, target_cls=None, prefix="") -> Entity:
+        if target_cls is None:
+            target_cls = self.entity_cls
+
+        result = {}
+
+        fields = (
+            target_cls.get_fields()
+            if hasattr(target_cls, "get_fields")
+            else self.get_embedded_fields(target_cls)
+        )
+
+        for name, field in fields.items():
+            key = f"{prefix}{name}"
+            field_type = field.type_ if hasattr(field, "type_") else type(field)
+
+            if self.is_embedded_type(field_type):
+                # A None embedded value is stored as NULL in all its columns
+                columns = self._column_keys(field_type, f"{key}_")
+                if columns and all(data.get(column) is None for column in columns):
+                    result[name] = None
+                else:
+                    result[name] = self.reflective_hydrate(data, field_type, prefix=f"{key}_")
+            elif key in data:
+                result[name] = data[key]
+            else:
+                result[name] = None
+        return target_cls(**result)
+
+    def _compile(self, entity_cls: type) -> CompiledHydration:
+        namespace: Dict[str, Any] = {}
+        columns: list = []
+        counter = itertools.count()
+
+        def ref(obj) -> str:
+            name = f"_ref{len(namespace)}"
+            namespace[name] = obj
+            return name
+
+        def field_exprs(cls, prefix: str) -> list:
+            exprs = []
+            for name, field in self.get_embedded_fields(cls).items():
+                key = f"{prefix}{name}"
+                if self._is_embedded_field(field):
+                    # A None embedded value is stored as NULL in all its columns
+                    nulls = " and ".join(
+                        f"get({column!r}) is None" for column in self._column_keys(field.type_, f"{key}_")
+                    ) or "False"
+                    exprs.append((name, f"(None if {nulls} else {hydrate_expr(field.type_, f'{key}_')})"))
+                else:
+                    columns.append(key)
+                    exprs.append((name, f"get({key!r})"))
+            return exprs
+
+        def hydrate_expr(cls, prefix: str, exprs: list | None = None) -> str:
+            args = [f"{name}={expr}" for name, expr in (field_exprs(cls, prefix) if exprs is None else exprs)]
+            # Rows come from our own tables, so entities skip per-field validation
+            factory = cls.from_trusted if issubclass(cls, Entity) else cls
+            return f"{ref(factory)}({', '.join(args)})"
+
+        top_level = field_exprs(entity_cls, "")
+
+        def deshydrate_lines(cls, source: str, prefix: str, indent: str) -> list:
+            lines = []
+            for name, field in self.get_embedded_fields(cls).items():
+                key = f"{prefix}{name}"
+                if self._is_embedded_field(field):
+                    var = f"_v{next(counter)}"
+                    lines.append(f"{indent}{var} = {source}.{name}")
+                    lines.append(f"{indent}if {var} is None:")
+                    lines.extend(
+                        f"{indent}    row[{column!r}] = None"
+                        for column in self._column_keys(field.type_, f"{key}_")
+                    )
+                    lines.append(f"{indent}else:")
+                    lines.extend(deshydrate_lines(field.type_, var, f"{key}_", indent + "    "))
+                else:
+                    lines.append(f"{indent}row[{key!r}] = {source}.{name}")
+            return lines
+
+        source = "\n".join([
+            "def hydrate(data):",
+            "    get = data.get",
+            f"    return {hydrate_expr(entity_cls, '', top_level)}",
+            "",
+            *itertools.chain.from_iterable(
+                (f"def _read_{i}(data):", "    get = data.get", f"    return {expr}", "")
+                for i, (_, expr) in enumerate(top_level)
+            ),
+            "def deshydrate(entity):",
+            "    row = {}",
+            *deshydrate_lines(entity_cls, "entity", "", "    "),
+            "    return row",
+        ])
+
+        exec(compile(source, f"<hydration {entity_cls.__qualname__}>", "exec"), namespace)
+        readers = {name: namespace[f"_read_{i}"] for i, (name, _) in enumerate(top_level)}
+        return CompiledHydration(namespace["hydrate"], namespace["deshydrate"], tuple(columns), readers)
+
+    def _column_keys(self, type_: Type, prefix: str) -> list:
+        keys = []
+        for name, field in self.get_embedded_fields(type_).items():
+            if self._is_embedded_field(field):
+                keys.extend(self._column_keys(field.type_, f"{prefix}{name}_"))
+            else:
+                keys.append(f"{prefix}{name}")
+        return keys
+
+    def _is_embedded_field(self, field: Any) -> bool:
+        return isinstance(field, Field) and self.is_embedded_type(field.type_)
+
+    def is_embedded_type(self, type_: Type) -> bool:
+        return (
+            isinstance(type_, type)
+            and (
+                is_dataclass(type_)
+                or issubclass(type_, BaseModel)
+                or issubclass(type_, Entity)
+                or hasattr(type_, "get_fields")
+            )
+        )
+
+    def get_embedded_fields(self, type_: Type) -> Dict:
+        if is_dataclass(type_):
+            return type_.__dataclass_fields__
+        if isinstance(type_, type) and issubclass(type_, BaseModel):
+            return type_.model_fields
+        if hasattr(type_, "get_fields"):
+            return type_.get_fields()
+        return {}
@@ -0,0 +1,52 @@
+from typing import Any, Callable
+
+from claybird.domain.entities import Entity, Field
+from claybird.domain.entities.entity import iter_fields
+
+
+class LazyField:
+    __slots__ = ("field", "name", "read")
+
+    def __init__(self, field: Field, read: Callable[[dict], Any]):
+        self.field = field
+        self.name = field.name
+        self.read = read
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self.field
+
+        values = instance._values
+        try:
+            return values[self.name]
+        except KeyError:
+            value = values[self.name] = self.read(instance._row)
+            return value
+
+    def __set__(self, instance, value):
+        self.field.validate_type(value)
+        instance._values[self.name] = value
+
+
+def build_entity_view(entity_cls: type[Entity], readers: dict[str, Callable[[dict], Any]]) -> type:
+    fields = entity_cls.get_fields()
+
+    @classmethod
+    def from_row(cls, row: dict):
+        view = new(cls)
+        view._row = row
+        view._values = {}
+        return view
+
+    new = object.__new__
+    namespace = {
+        "__slots__": ("_row", "_values"),
+        "__module__": entity_cls.__module__,
+        "__qualname__": entity_cls.__qualname__,
+        # Serializers such as FastAPI's fall back to dict(entity)
+        "__iter__": iter_fields,
+        "from_row": from_row,
+        **{name: LazyField(field, readers[name]) for name, field in fields.items()},
+    }
+    # A subclass keeps isinstance checks and every Entity method working on the view
+    return type(entity_cls)(entity_cls.__name__, (entity_cls,), namespace)
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Callable
+
+
+def _contains(value: Any) -> str:
+    return f"%{value}%"
+
+
+def _starts_with(value: Any) -> str:
+    return f"{value}%"
+
+
+def _ends_with(value: Any) -> str:
+    return f"%{value}"
+
+
+class FinderPlan:
+
+    placeholder = "%s"
+
+    PREFIXES = {
+        "find_by_": "find",
+        "get_by_": "find",
+        "count_by_": "count",
+        "delete_by_": "delete",
+        "stream_by_": "stream",
+    }
+
+    # find_first_by_... / find_top_10_by_...
+    LIMITED_PREFIX = re.compile(r"(?:find|get)_(first|top_(\d+))_by_")
+
+    AGGREGATES = {
+        "sum_": "SUM",
+        "avg_": "AVG",
+        "min_": "MIN",
+        "max_": "MAX",
+    }
+
+    # Longer suffixes first so "_not_like" is not mistaken for "_like".
+    OPERATORS: dict[str, tuple[str, Callable[[Any], Any] | None]] = {
+        "_is_not_null": ("IS NOT NULL", None),
+        "_is_null": ("IS NULL", None),
+        "_not_in": ("NOT IN", None),
+        "_in": ("IN", None),
+        "_between": ("BETWEEN", None),
+        "_less_than": ("<", None),
+        "_greater_than": (">", None),
+        "_before": ("<", None),
+        "_after": (">", None),
+        "_not_like": ("NOT LIKE", _contains),
+        "_like": ("LIKE", _contains),
+        "_starts_with": ("LIKE", _starts_with),
+        "_ends_with": ("LIKE", _ends_with),
+    }
+
+    # Arguments taken by each operator, 1 when missing
+    ARITY = {"IS NULL": 0, "IS NOT NULL": 0, "BETWEEN": 2}
+
+    __slots__ = (
+        "name", "action", "conditions", "connectors", "where", "transformers",
+        "target", "function", "order_by", "limit", "single", "arity", "expanding",
+        "_simple", "_statements",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        action: str,
+        raw_fields: str,
+        target: str | None = None,
+        function: str | None = None,
+        limit: int | None = None,
+        single: bool = False,
+        columns: frozenset[str] | None = None,
+    ):
+        raw_fields, _, raw_order = raw_fields.partition("_order_by_")
+        if raw_order and action not in ("find", "stream"):
+            raise ValueError(f"{name}: only find and stream methods can be ordered")
+
+        parts = re.split(r"_and_|_or_", raw_fields) if raw_fields else []
+        connectors = re.findall(r"_and_|_or_", raw_fields)
+
+        self.name = name
+        self.action = action
+        self.conditions = [self._parse_condition(p, columns) for p in parts]
+        self.connectors = connectors
+        self.transformers = tuple(transform for _, _, transform in self.conditions)
+        self.arity = sum(self.ARITY.get(op, 1) for _, op, _ in self.conditions)
+        # Argument positions of IN lists, whose size shapes the statement
+        self.expanding = self._expanding_positions(self.conditions)
+        self._simple = self.arity == len(self.conditions) and not self.expanding
+        self.where = self._build_where(self.conditions, connectors, self.placeholder) if parts else None
+        # Aggregated or grouped column
+        self.target = target
+        self.function = function
+        self.order_by = [self._parse_order(part, columns) for part in raw_order.split("_and_")] if raw_order else []
+        self.limit = limit
+        self.single = single
+        self._statements: dict[Any, str] = {}
+
+        if columns is not None:
+            referenced = [column for column, _, _ in self.conditions] + [column for column, _ in self.order_by]
+            if target is not None:
+                referenced.append(target)
+            unknown = [column for column in dict.fromkeys(referenced) if column not in columns]
+            if unknown:
+                raise ValueError(f"unknown column(s) {', '.join(unknown)}")
+
+    @classmethod
+    def compile(cls, name: str, columns: frozenset[str] | None = None) -> FinderPlan | None:
+        # With the entity columns known, operator suffixes only apply when what
+        # precedes them is a column: find_by_logged_in stays an equality
+        if name.startswith("group_count_by_"):
+            target, _, raw_fields = name[len("group_count_by_"):].partition("_where_")
+            return cls(name, "group_count", raw_fields, target, columns=columns) if target else None
+
+        for prefix, function in cls.AGGREGATES.items():
+            if name.startswith(prefix):
+                target, _, raw_fields = name[len(prefix):].partition("_by_")
+                return cls(name, "aggregate", raw_fields, target, function, columns=columns) if target else None
+
+        match = cls.LIMITED_PREFIX.match(name)
+        if match:
+            first, top = match.groups()
+            limit = 1 if top is None else int(top)
+            return cls(name, "find", name[match.end():], limit=limit, single=top is None, columns=columns)
+
+        for prefix, action in cls.PREFIXES.items():
+            if not name.startswith(prefix):
+                continue
+
+            raw_fields = name[len(prefix):]
+            if action == "find" and raw_fields.endswith("_page"):
+                action = "page"
+                raw_fields = raw_fields[:-len("_page")]
+
+            return cls(name, action, raw_fields, columns=columns)
+
+        return None
+
+    @classmethod
+    def _parse_condition(
+        cls, part: str, columns: frozenset[str] | None = None
+    ) -> tuple[str, str, Callable[[Any], Any] | None]:
+        if columns is not None and part in columns:
+            return part, "=", None
+
+        for suffix, (op, transform) in cls.OPERATORS.items():
+            if part.endswith(suffix) and (columns is None or part[:-len(suffix)] in columns):
+                return part[:-len(suffix)], op, transform
+
+        return part, "=", None
+
+    @staticmethod
+    def _parse_order(part: str, columns: frozenset[str] | None = None) -> tuple[str, bool]:
+        if columns is not None and part in columns:
+            return part, False
+        if part.endswith("_desc"):
+            return part[:-len("_desc")], True
+        if part.endswith("_asc"):
+            return part[:-len("_asc")], False
+        return part, False
+
+    @classmethod
+    def _expanding_positions(cls, conditions) -> tuple[int, ...]:
+        positions = []
+        position = 0
+        for _, op, _ in conditions:
+            if op in ("IN", "NOT IN"):
+                positions.append(position)
+            position += cls.ARITY.get(op, 1)
+        return tuple(positions)
+
+    @classmethod
+    def _build_where(cls, conditions, connectors, placeholder: str, sizes: tuple[int, ...] = ()) -> str:
+        sizes = iter(sizes)
+        clauses = [cls._build_clause(field, op, placeholder, sizes) for field, op, _ in conditions]
+
+        sql = clauses[0]
+        for clause, conn in zip(clauses[1:], connectors):
+            sql += f" {'AND' if '_and_' in conn else 'OR'} {clause}"
+
+        return sql
+
+    @staticmethod
+    def _build_clause(field: str, op: str, placeholder: str, sizes) -> str:
+        if op in ("IS NULL", "IS NOT NULL"):
+            return f"`{field}` {op}"
+        if op == "BETWEEN":
+            return f"`{field}` BETWEEN {placeholder} AND {placeholder}"
+        if op in ("IN", "NOT IN"):
+            size = next(sizes, None)
+            if size is None:
+                # Placeholder rendering, the real statement depends on the list sizes
+                return f"`{field}` {op} (...)"
+            if size == 0:
+                return "1 = 0" if op == "IN" else "1 = 1"
+            return f"`{field}` {op} ({', '.join([placeholder] * size)})"
+        return f"`{field}` {op} {placeholder}"
+
+    def bind(self, values: tuple) -> list[Any]:
+        if len(values) != self.arity:
+            raise ValueError("Invalid argument count")
+
+        if self._simple:
+            return [
+                value if transform is None else transform(value)
+                for transform, value in zip(self.transformers, values)
+            ]
+
+        params: list[Any] = []
+        position = 0
+        for _, op, transform in self.conditions:
+            arity = self.ARITY.get(op, 1)
+            if op in ("IN", "NOT IN"):
+                params.extend(values[position])
+            else:
+                params.extend(
+                    value if transform is None else transform(value)
+                    for value in values[position:position + arity]
+                )
+            position += arity
+        return params
+
+    def where_for(self, values: tuple) -> str | None:
+        if not self.expanding:
+            return self.where
+        return self._build_where(self.conditions, self.connectors, self.placeholder, self._sizes(values))
+
+    def statement(self, table_name: str, values: tuple = (), select: str = "*") -> str:
+        key = table_name if select == "*" else (table_name, select)
+        if self.expanding:
+            key = (key, self._sizes(values))
+
+        sql = self._statements.get(key)
+        if sql is None:
+            sql = self._statements[key] = self._build_statement(table_name, values, select)
+        return sql
+
+    def _sizes(self, values: tuple) -> tuple[int, ...]:
+        if len(values) != self.arity:
+            raise ValueError("Invalid argument count")
+        return tuple(len(values[position]) for position in self.expanding)
+
+    def _build_statement(self, table_name: str, values: tuple = (), select: str = "*") -> str:
+        where = self.where_for(values)
+        where = f" WHERE {where}" if where else ""
+
+        if self.action in ("find", "stream"):
+            sql = f"SELECT {select} FROM `{table_name}`{where}"
+            if self.order_by:
+                sql += " ORDER BY " + ", ".join(
+                    f"`{column}` {'DESC' if descending else 'ASC'}" for column, descending in self.order_by
+                )
+            if self.limit is not None:
+                sql += f" LIMIT {self.limit}"
+            return sql
+        if self.action == "count":
+            return f"SELECT COUNT(*) AS count FROM `{table_name}`{where}"
+        if self.action == "delete":
+            return f"DELETE FROM `{table_name}`{where}"
+        if self.action == "aggregate":
+            return f"SELECT {self.function}(`{self.target}`) FROM `{table_name}`{where}"
+        if self.action == "group_count":
+            return f"SELECT `{self.target}`, COUNT(*) FROM `{table_name}`{where} GROUP BY `{self.target}`"
+        raise ValueError(f"Action {self.action} has no fixed statement")
@@ -1,11 +1,13 @@
 from claybird.application.ports.outbound.connection_handler_port import ConnectionHandlerPort
 from claybird.application.ports.outbound.crud_repository_port import CrudRepositoryPort
+from claybird.application.ports.outbound.unit_of_work_port import UnitOfWorkPort
 
 
 class MysqlConnectionHandler(ConnectionHandlerPort):
 
     async def start_connection(self, definition: dict) -> dict:
-        import aiomysql
+        from claybird.infrastructure.adapters.outbound.persistance.mysql.mysql_pool_router import MysqlPoolRouter
+        from claybird.infrastructure.adapters.outbound.persistance.mysql.mysql_schema_inspector import MysqlSchemaInspector
 
         connection = {
             "engine": definition.get("engine"),
@@ -14,6 +16,13 @@ class MysqlConnectionHandler(ConnectionHandlerPort):
             "user": definition.get("user"),
             "password": definition.get("password"),
             "schema": definition.get("schema"),
+            "minsize": int(definition.get("minsize", 1)),
+            "maxsize": int(definition.get("maxsize", 10)),
+            "pool_recycle": int(definition.get("pool_recycle", -1)),
+            "connect_timeout": definition.get("connect_timeout"),
+            "acquire_timeout": definition.get("acquire_timeout"),
+            "warmup": definition.get("warmup", True),
+            "schema_check": definition.get("schema_check", True),
         }
 
         if not all([
@@ -25,17 +34,57 @@ class MysqlConnectionHandler(ConnectionHandlerPort):
         ]):
             raise ValueError("Invalid MySQL connection definition")
 
-        connection["pool"] = await aiomysql.create_pool(
-            host=connection["host"],
-            port=connection["port"],
-            user=connection["user"],
-            password=connection["password"],
-            db=connection["schema"],
-            autocommit=True,
+        if not 0 <= connection["minsize"] <= connection["maxsize"]:
+            raise ValueError("Invalid MySQL pool size: expected 0 <= minsize <= maxsize")
+
+        # Replicas default to the primary's credentials and schema
+        connection["replicas"] = [
+            {**connection, **replica, "port": int(replica.get("port", connection["port"]))}
+            for replica in definition.get("replicas", [])
+        ]
+
+        connection["pool"] = await self._create_pool(connection)
+        connection["router"] = MysqlPoolRouter(
+            connection["pool"],
+            [await self._create_pool(replica) for replica in connection["replicas"]],
+            strategy=definition.get("replica_strategy", "round_robin"),
+            read_your_writes=definition.get("read_your_writes", False),
         )
+        connection["metrics"] = connection["router"].metrics
+        connection["schema_inspector"] = MysqlSchemaInspector(connection["pool"], connection["schema"])
 
         return connection
 
+    @staticmethod
+    async def _create_pool(connection: dict):
+        import aiomysql
+        from claybird.infrastructure.adapters.outbound.persistance.mysql.mysql_pool import MysqlPool
+
+        connect_timeout = connection["connect_timeout"]
+        acquire_timeout = connection["acquire_timeout"]
+        pool = MysqlPool(
+            await aiomysql.create_pool(
+                host=connection["host"],
+                port=connection["port"],
+                user=connection["user"],
+                password=connection["password"],
+                db=connection["schema"],
+                autocommit=True,
+                minsize=int(connection["minsize"]),
+                maxsize=int(connection["maxsize"]),
+                pool_recycle=int(connection["pool_recycle"]),
+                connect_timeout=None if connect_timeout is None else float(connect_timeout),
+            ),
+            acquire_timeout=None if acquire_timeout is None else float(acquire_timeout),
+        )
+
+        # True pings the minsize connections create_pool opened, an int opens and pings that many
+        warmup = connection["warmup"]
+        if warmup:
+            await pool.warm_up(None if warmup is True else int(warmup))
+
+        return pool
+
     async def get_engine_adapter(self, connection: dict, port: type):
         pool = connection.get("pool")
         if pool is None:
@@ -43,8 +92,14 @@ class MysqlConnectionHandler(ConnectionHandlerPort):
 
         if port is CrudRepositoryPort:
             from claybird.infrastructure.adapters.outbound.persistance.mysql.mysql_crud_repository import MysqlCrudRepository
-            return MysqlCrudRepository(pool)
+            repository = MysqlCrudRepository(pool, connection.get("router"), connection.get("schema_inspector"))
+            repository.schema_check = connection.get("schema_check", True)
+            return repository
+
+        if port is UnitOfWorkPort:
+            from claybird.infrastructure.adapters.outbound.persistance.mysql.mysql_unit_of_work import MysqlUnitOfWork
+            return MysqlUnitOfWork(connection["router"])
 
         raise KeyError(
             f"{port.__name__} is not implemented for MySQL engine"
-        )
\ No newline at end of file
+        )
@@ -1,31 +1,36 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
 import uuid
 import decimal
-import re
 from enum import Enum
-from dataclasses import is_dataclass
 from typing import Any, Iterable
 
-from aiomysql.pool import Pool
-from aiomysql import DictCursor
-from pydantic import BaseModel
-from dataclasses import is_dataclass, Field as DataclassField
+from aiomysql import DictCursor, SSCursor, SSDictCursor
+from pymysql.err import OperationalError
 
-from claybird.application.ports.outbound.crud_repository_port import CrudRepositoryPort
 from claybird.infrastructure.adapters.outbound.events import EventBus
-from claybird.domain.entities.entity import Entity
-from claybird.domain.entities.field import Field
 from claybird.domain.entities import field_type
-from claybird.infrastructure.adapters.shared import camel_to_snake
-from claybird.infrastructure.adapters.outbound.persistance.mysql.mysql_entity_hydratator import MysqlEntityHydratator
-
-class MysqlCrudRepository(CrudRepositoryPort):
-    table_name: str | None = None
+from claybird.infrastructure.adapters.outbound.persistance.sql_crud_repository import SqlCrudRepository
+from claybird.infrastructure.adapters.outbound.persistance.mysql.mysql_finder_plan import MysqlFinderPlan
+from claybird.infrastructure.adapters.outbound.persistance.mysql.mysql_pool import MysqlPool
+from claybird.infrastructure.adapters.outbound.persistance.mysql.mysql_pool_router import MysqlPoolRouter
+from claybird.infrastructure.adapters.outbound.persistance.mysql.mysql_schema_inspector import MysqlSchemaInspector
+from claybird.infrastructure.adapters.outbound.persistance.mysql.mysql_statement_cache import MysqlStatementCache
+
+class MysqlCrudRepository(SqlCrudRepository):
     schema: str | None = None
-    entity_cls: type[Entity]
-    entity_hydrator: MysqlEntityHydratator
+    statements: MysqlStatementCache
+
+    placeholder = "%s"
+    table_options = " ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"
+    max_identifier_length = 64
+    # TEXT and BLOB columns can only be indexed by a prefix
+    index_prefix_length = 255
+    plan_cls = MysqlFinderPlan
+    statement_cache_cls = MysqlStatementCache
+    _plans: dict[tuple, MysqlFinderPlan] = {}
 
     _TYPE_MAP = {
         str: "VARCHAR(255)",
@@ -41,272 +46,134 @@ class MysqlCrudRepository(CrudRepositoryPort):
         field_type.JSON: "JSON"
     }
 
-    def __init__(self, pool: Pool):
+    def __init__(
+        self,
+        pool: MysqlPool,
+        router: MysqlPoolRouter | None = None,
+        inspector: MysqlSchemaInspector | None = None,
+    ):
         self.pool = pool
+        self.router = router or MysqlPoolRouter(pool)
         self.schema = pool._conn_kwargs.get("db")
+        self.inspector = inspector or MysqlSchemaInspector(pool, self.schema)
 
     @EventBus.on("start")
     async def _lazy_init(self):
-        self.table_name = self.table_name or camel_to_snake(self.entity_cls.__name__)
-        self.entity_hydratator = MysqlEntityHydratator(self.entity_cls)
-        if not await self.table_exists():
-            await self.create_table()
-
-    async def create_table(self):
-        columns = self._build_columns(self.entity_cls.get_fields())
-        query = f"""
-            CREATE TABLE `{self.table_name}` (
-                {", ".join(columns)}
-            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-        """
-
-        async with self.pool.acquire() as conn:
-            async with conn.cursor() as cursor:
-                await cursor.execute(query)
-                await conn.commit()
-
-    def _build_columns(self, fields: dict[str, Field]) -> list[str]:
-        columns: list[str] = []
-
-        for name, field in fields.items():
-            if self.entity_hydratator.is_embedded_type(field.type_):
-                columns.extend(self._build_embedded_columns(name, field.type_))
-            else:
-                columns.append(self._column_sql(name, field))
-
-        return columns
-
-    def _build_embedded_columns(self, prefix: str, type_: type) -> list[str]:
-        embedded_fields = self.entity_hydratator.get_embedded_fields(type_)
-        columns = []
-
-        for sub_name, sub_field in embedded_fields.items():
-
-            if isinstance(sub_field, Field):
-                field = sub_field
-
-            elif isinstance(sub_field, DataclassField):
-                field = Field(type_=sub_field.type)
-
-            else:
-                field = Field(type_=sub_field.annotation)
-
-            columns.append(
-                self._column_sql(f"{prefix}_{sub_name}", field)
-            )
-
-        return columns
-
-    def _column_sql(self, name: str, field: Field) -> str:
-        column_type = self._resolve_column_type(field.type_)
-        parts = [f"`{name}` {column_type}"]
-
-        if field.primary_key:
-            parts.append("PRIMARY KEY")
-
-        if field.required:
-            parts.append("NOT NULL")
-
-        if field.default is not None and not callable(field.default):
-            default = str(field.default).replace("'", "''")
-            parts.append(f"DEFAULT '{default}'")
-
-        return " ".join(parts)
+        # Run in a task of its own so the CREATE TABLE write does not pin the
+        # bootstrap context (inherited by the server) to the primary
+        await asyncio.ensure_future(super()._lazy_init())
+
+    async def create_table(self) -> list[str]:
+        try:
+            created_indexes = await super().create_table()
+        except BaseException:
+            self.inspector.invalidate()
+            raise
+        self.inspector.record(self.table_name)
+        return created_indexes
+
+    async def _create_index(self, name: str):
+        try:
+            await super()._create_index(name)
+        except OperationalError as e:
+            # Another repository on the same table created it meanwhile (ER_DUP_KEYNAME)
+            if e.args[0] != 1061:
+                self.inspector.invalidate()
+                raise
+        self.inspector.record(self.table_name, name)
+
+    def _index_column_sql(self, column: str) -> str:
+        column_type = self._resolve_column_type(self.column_types.get(column))
+        if column_type == "JSON":
+            raise ValueError(f"JSON column '{column}' of `{self.table_name}` cannot be indexed in MySQL")
+        if column_type in ("LONGTEXT", "BLOB"):
+            return f"`{column}`({self.index_prefix_length})"
+        return f"`{column}`"
 
     def _resolve_column_type(self, python_type: type) -> str:
         if isinstance(python_type, type) and issubclass(python_type, Enum):
             values = "', '".join(e.value for e in python_type)
             return f"ENUM('{values}')"
 
-        return self._TYPE_MAP.get(python_type, "VARCHAR(255)")
-
-    async def table_exists(self) -> bool:
-        query = """
-            SELECT COUNT(*)
-            FROM information_schema.tables
-            WHERE table_schema = %s
-              AND table_name = %s
-        """
-
-        async with self.pool.acquire() as conn:
-            async with conn.cursor() as cursor:
-                await cursor.execute(query, (self.schema, self.table_name))
-                (count,) = await cursor.fetchone()
-
-        return count > 0
+        return super()._resolve_column_type(python_type)
 
-    async def save(self, entity: Entity):
-        deshydrated = self.entity_hydratator.deshydrate(entity)
-        keys = deshydrated.keys()
-        values = tuple(deshydrated.values())
+    async def get(self, id_: Any, fields: Any = None):
+        # Pinned reads (read-your-writes or inside a transaction) must not share
+        # a coalesced batch that runs on another connection
+        if fields is None and self.router.pinned:
+            return await self._get_one(id_)
+        return await super().get(id_, fields)
 
-        columns = ", ".join(f"`{k}`" for k in keys)
-        placeholders = ", ".join("%s" for _ in keys)
-        updates = ", ".join(f"`{k}` = new.`{k}`" for k in keys)
+    async def save_batch(self, entities, batch_size: int | None = None, concurrency: int | None = None):
+        # Chunks are written from child tasks, so pin the caller's context here
+        self.router.pin()
+        return await super().save_batch(entities, batch_size, concurrency)
 
-        query = f"""
-        INSERT INTO `{self.table_name}` ({columns})
-        VALUES ({placeholders}) AS new
-        ON DUPLICATE KEY UPDATE {updates}
-        """
-        
-        async with self.pool.acquire() as conn:
-            async with conn.cursor() as cursor:
-                await cursor.execute(query, values)
-
-    async def save_batch(self, entities: list[Entity]):
-        if not entities:
-            return
+    @property
+    def in_transaction(self) -> bool:
+        return self.router.in_transaction
 
-        rows = [self.entity_hydratator.deshydrate(e) for e in entities]
+    def after_transaction(self, callback):
+        self.router.after_transaction(callback)
 
-        keys = rows[0].keys()
-        pk = self.entity_cls.get_primary_key()
-
-        columns = ", ".join(f"`{k}`" for k in keys)
-        placeholders = "(" + ", ".join("%s" for _ in keys) + ")"
-        values_sql = ", ".join(placeholders for _ in rows)
-
-        values: list[Any] = []
-        for row in rows:
-            values.extend(tuple(row.values()))
-
-        updates = ", ".join(
-            f"`{k}` = new.`{k}`"
-            for k in keys
-            if k != pk
-        )
-
-        query = f"""
-            INSERT INTO `{self.table_name}` ({columns})
-            VALUES {values_sql} AS new
-            ON DUPLICATE KEY UPDATE {updates}
-        """
-
-        async with self.pool.acquire() as conn:
-            async with conn.cursor() as cursor:
-                await cursor.execute(query, values)
-                await conn.commit()
+    async def table_exists(self) -> bool:
+        return await self.inspector.indexes(self.table_name) is not None
 
-    async def get(self, id_: Any):
-        pk = self.entity_cls.get_primary_key()
-        query = f"SELECT * FROM `{self.table_name}` WHERE `{pk}` = %s"
+    async def existing_indexes(self) -> set[str]:
+        return await self.inspector.indexes(self.table_name) or set()
 
-        async with self.pool.acquire() as conn:
+    async def _fetch_rows(self, query: str, params: Iterable[Any] = ()) -> list[dict]:
+        async with self.router.connection(read=True) as conn:
             async with conn.cursor(DictCursor) as cursor:
-                await cursor.execute(query, (id_,))
-                row = await cursor.fetchone()
-
-        return self.entity_hydratator.hydrate(row)
+                await cursor.execute(query, params)
+                return await cursor.fetchall()
 
-    async def delete(self, id_: Any):
-        pk = self.entity_cls.get_primary_key()
-        query = f"DELETE FROM `{self.table_name}` WHERE `{pk}` = %s"
-
-        async with self.pool.acquire() as conn:
+    async def _fetch_tuples(self, query: str, params: Iterable[Any] = ()) -> list[tuple]:
+        async with self.router.connection(read=True) as conn:
             async with conn.cursor() as cursor:
-                await cursor.execute(query, (id_,))
-
-    async def get_all(self):
-        query = f"SELECT * FROM `{self.table_name}`"
-
-        async with self.pool.acquire() as conn:
-            async with conn.cursor(DictCursor) as cursor:
-                await cursor.execute(query)
-                rows = await cursor.fetchall()
-        return [self.entity_hydratator.hydrate(r) for r in rows]
-
-    def __getattr__(self, name: str):
-        prefixes = {
-            "find_by_": "find",
-            "get_by_": "find",
-            "count_by_": "count",
-            "delete_by_": "delete",
-        }
+                await cursor.execute(query, params)
+                return await cursor.fetchall()
 
-        for prefix, action in prefixes.items():
-            if name.startswith(prefix):
-                return self._build_dynamic_method(action, name[len(prefix):])
-
-        raise AttributeError(f"{self.__class__.__name__} has no attribute {name}")
-
-    def _build_dynamic_method(self, action: str, raw_fields: str):
-        parts = re.split(r"_and_|_or_", raw_fields)
-        connectors = re.findall(r"_and_|_or_", raw_fields)
+    async def _execute(self, query: str, params: Iterable[Any] = ()) -> int:
+        async with self.router.connection() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(query, params)
+                return cursor.rowcount
+
+    async def _stream_rows(self, query: str, params: Iterable[Any], chunk_size: int, as_tuples: bool = False):
+        if self.in_transaction:
+            # An unbuffered result would be cut short by any other statement on the
+            # shared connection, so it is read whole under the transaction lock
+            rows = await (self._fetch_tuples if as_tuples else self._fetch_rows)(query, params)
+            for start in range(0, len(rows), chunk_size):
+                yield rows[start:start + chunk_size]
+            return
 
-        conditions = [self._parse_condition(p) for p in parts]
+        async with self.router.connection(read=True) as conn:
+            async with conn.cursor(SSCursor if as_tuples else SSDictCursor) as cursor:
+                await cursor.execute(query, params)
+                while True:
+                    rows = await cursor.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    yield rows
 
-        async def method(*values):
-            if len(values) != len(conditions):
-                raise ValueError("Invalid argument count")
+    async def _insert_rows(self, rows: list[tuple]):
+        query = self.statements.batch_insert(len(rows))
+        values = [value for row in rows for value in row]
 
-            where, params = self._build_where(conditions, connectors, values)
-            sql = self._build_action_sql(action, where)
+        async with self.router.connection() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(query, values)
 
+    async def _max_batch_bytes(self) -> int:
+        if self.max_batch_bytes is None:
             async with self.pool.acquire() as conn:
-                async with conn.cursor(DictCursor) as cursor:
-                    await cursor.execute(sql, params)
-
-                    if action == "find":
-                        return [self.entity_hydratator.hydrate(r) for r in await cursor.fetchall()]
-                    if action == "count":
-                        return (await cursor.fetchone())["count"]
-                    if action == "delete":
-                        return cursor.rowcount
-
-        return method
-
-    @staticmethod
-    def _parse_condition(part: str) -> tuple[str, str]:
-        rules = {
-            "_less_than": "<",
-            "_greater_than": ">",
-            "_before": "<",
-            "_after": ">",
-            "_like": "LIKE",
-            "_not_like": "NOT LIKE",
-            "_starts_with": "LIKE_START",
-            "_ends_with": "LIKE_END",
-        }
-
-        for suffix, op in rules.items():
-            if part.endswith(suffix):
-                return part[:-len(suffix)], op
-
-        return part, "="
-
-    @staticmethod
-    def _build_where(conditions, connectors, values):
-        clauses, params = [], []
-
-        for (field, op), value in zip(conditions, values):
-            if op == "LIKE":
-                clauses.append(f"`{field}` LIKE %s")
-                params.append(f"%{value}%")
-            elif op == "NOT LIKE":
-                clauses.append(f"`{field}` NOT LIKE %s")
-                params.append(f"%{value}%")
-            elif op == "LIKE_START":
-                clauses.append(f"`{field}` LIKE %s")
-                params.append(f"{value}%")
-            elif op == "LIKE_END":
-                clauses.append(f"`{field}` LIKE %s")
-                params.append(f"%{value}")
-            else:
-                clauses.append(f"`{field}` {op} %s")
-                params.append(value)
-
-        sql = clauses[0]
-        for clause, conn in zip(clauses[1:], connectors):
-            sql += f" {'AND' if '_and_' in conn else 'OR'} {clause}"
+                async with conn.cursor() as cursor:
+                    await cursor.execute("SELECT @@max_allowed_packet")
+                    (max_allowed_packet,) = await cursor.fetchone()
 
-        return sql, params
+            # Leave room for the statement text and escaping overhead
+            self.max_batch_bytes = int(max_allowed_packet * 0.75)
 
-    def _build_action_sql(self, action: str, where: str) -> str:
-        if action == "find":
-            return f"SELECT * FROM `{self.table_name}` WHERE {where}"
-        if action == "count":
-            return f"SELECT COUNT(*) AS count FROM `{self.table_name}` WHERE {where}"
-        if action == "delete":
-            return f"DELETE FROM `{self.table_name}` WHERE {where}"
-        raise ValueError(f"Unknown action {action}")
\ No newline at end of file
+        return self.max_batch_bytes
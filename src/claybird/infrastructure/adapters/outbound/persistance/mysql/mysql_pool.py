@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+from aiomysql.pool import Pool
+
+
+@dataclass
+class PoolMetrics:
+    BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+    acquires: int = 0
+    wait_seconds: float = 0.0
+    wait_buckets: list[int] = field(default_factory=lambda: [0] * (len(PoolMetrics.BUCKETS) + 1))
+    exhausted: int = 0
+    timeouts: int = 0
+    last_exhausted_at: float | None = None
+
+    def observe(self, seconds: float):
+        self.acquires += 1
+        self.wait_seconds += seconds
+        self.wait_buckets[bisect.bisect_left(self.BUCKETS, seconds)] += 1
+
+
+class MysqlPool:
+
+    def __init__(self, pool: Pool, acquire_timeout: float | None = None):
+        self.pool = pool
+        self.acquire_timeout = acquire_timeout
+        self.metrics = PoolMetrics()
+        # Connections held or being waited for through this wrapper
+        self._demand = 0
+
+    @asynccontextmanager
+    async def acquire(self):
+        pool = self.pool
+        if self._demand >= pool.maxsize:
+            self.metrics.exhausted += 1
+            self.metrics.last_exhausted_at = time.time()
+
+        self._demand += 1
+        started = time.perf_counter()
+        try:
+            conn = await asyncio.wait_for(pool.acquire(), self.acquire_timeout)
+        except asyncio.TimeoutError:
+            self._demand -= 1
+            self.metrics.timeouts += 1
+            raise TimeoutError(
+                f"Timed out after {self.acquire_timeout}s waiting for a MySQL connection "
+                f"({pool.size - pool.freesize}/{pool.maxsize} in use)"
+            ) from None
+        except BaseException:
+            self._demand -= 1
+            raise
+        self.metrics.observe(time.perf_counter() - started)
+
+        try:
+            yield conn
+        finally:
+            self._demand -= 1
+            await pool.release(conn)
+
+    async def warm_up(self, count: int | None = None):
+        # create_pool already opened minsize connections, so by default they are
+        # only pinged; a larger count opens the rest
+        count = min(count or self.pool.minsize, self.pool.maxsize)
+        # Hold them all at once so the pool has to open `count` connections
+        results = await asyncio.gather(*(self.pool.acquire() for _ in range(count)), return_exceptions=True)
+        conns = [result for result in results if not isinstance(result, BaseException)]
+        try:
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            await asyncio.gather(*(conn.ping() for conn in conns))
+        finally:
+            for conn in conns:
+                await self.pool.release(conn)
+
+    def snapshot(self) -> dict:
+        pool, metrics = self.pool, self.metrics
+        buckets = {str(bound): count for bound, count in zip(metrics.BUCKETS, metrics.wait_buckets)}
+        buckets["+Inf"] = metrics.wait_buckets[-1]
+
+        return {
+            "size": pool.size,
+            "maxsize": pool.maxsize,
+            "in_use": pool.size - pool.freesize,
+            "idle": pool.freesize,
+            "acquires": metrics.acquires,
+            "acquire_wait": {
+                "buckets": buckets,
+                "sum": metrics.wait_seconds,
+                "count": metrics.acquires,
+            },
+            "exhausted": metrics.exhausted,
+            "last_exhausted_at": metrics.last_exhausted_at,
+            "timeouts": metrics.timeouts,
+        }
+
+    def __getattr__(self, name: str):
+        return getattr(self.pool, name)
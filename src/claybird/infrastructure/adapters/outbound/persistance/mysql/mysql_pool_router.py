@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable
+
+from claybird.infrastructure.adapters.outbound.persistance.mysql.mysql_pool import MysqlPool
+
+
+class MysqlPoolRouter:
+
+    STRATEGIES = ("round_robin", "least_busy")
+
+    def __init__(
+        self,
+        primary: MysqlPool,
+        replicas: list[MysqlPool] | None = None,
+        strategy: str = "round_robin",
+        read_your_writes: bool = False,
+    ):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown replica strategy '{strategy}'")
+
+        self.primary = primary
+        self.replicas = replicas or []
+        self.strategy = strategy
+        self.read_your_writes = read_your_writes
+        self._cycle = itertools.cycle(self.replicas)
+        # Context-local, so a write only pins the request (task) that made it
+        self._pinned: ContextVar[bool] = ContextVar(f"claybird_mysql_pinned_{id(self)}", default=False)
+        # (connection, lock, callbacks to run once it ends) of the transaction open in the current context
+        self._transaction: ContextVar[tuple[Any, asyncio.Lock, list] | None] = ContextVar(
+            f"claybird_mysql_transaction_{id(self)}", default=None
+        )
+
+    @property
+    def pinned(self) -> bool:
+        return self._pinned.get() or self._transaction.get() is not None
+
+    @property
+    def in_transaction(self) -> bool:
+        return self._transaction.get() is not None
+
+    @asynccontextmanager
+    async def connection(self, read: bool = False):
+        transaction = self._transaction.get()
+        if transaction is None:
+            async with (self.read_pool() if read else self.write_pool()).acquire() as conn:
+                yield conn
+            return
+
+        conn, lock, _ = transaction
+        # Tasks spawned inside the block share the connection, one statement at a time
+        async with lock:
+            yield conn
+
+    @asynccontextmanager
+    async def transaction(self):
+        if self._transaction.get() is not None:
+            # Nested blocks join the outer transaction
+            yield
+            return
+
+        callbacks: list[Callable[[], Awaitable[Any]]] = []
+        async with self.primary.acquire() as conn:
+            await conn.begin()
+            token = self._transaction.set((conn, asyncio.Lock(), callbacks))
+            try:
+                yield
+            except BaseException:
+                await conn.rollback()
+                raise
+            else:
+                await conn.commit()
+            finally:
+                self._transaction.reset(token)
+                for callback in callbacks:
+                    await callback()
+
+    def after_transaction(self, callback: Callable[[], Awaitable[Any]]):
+        # Called after the current transaction commits or rolls back
+        transaction = self._transaction.get()
+        if transaction is None:
+            raise RuntimeError("No transaction is open in this context")
+        transaction[2].append(callback)
+
+    def read_pool(self) -> MysqlPool:
+        if not self.replicas or self._pinned.get():
+            return self.primary
+
+        if self.strategy == "least_busy":
+            return min(self.replicas, key=lambda pool: pool.size - pool.freesize)
+        return next(self._cycle)
+
+    def write_pool(self) -> MysqlPool:
+        self.pin()
+        return self.primary
+
+    def pin(self):
+        if self.read_your_writes and self.replicas:
+            self._pinned.set(True)
+
+    def metrics(self) -> dict:
+        return {
+            "primary": self.primary.snapshot(),
+            "replicas": [replica.snapshot() for replica in self.replicas],
+        }
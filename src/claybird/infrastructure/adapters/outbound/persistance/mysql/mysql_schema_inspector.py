@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+
+from claybird.infrastructure.adapters.outbound.persistance.mysql.mysql_pool import MysqlPool
+
+
+class MysqlSchemaInspector:
+
+    def __init__(self, pool: MysqlPool, schema: str):
+        self.pool = pool
+        self.schema = schema
+        self._snapshot: asyncio.Future | None = None
+
+    # Index names of the table, None when it does not exist
+    async def indexes(self, table_name: str) -> set[str] | None:
+        snapshot = await self.snapshot()
+        return snapshot.get(table_name)
+
+    async def snapshot(self) -> dict[str, set[str]]:
+        # Every repository of the schema shares one information_schema round trip
+        if self._snapshot is None:
+            self._snapshot = asyncio.ensure_future(self._load())
+        try:
+            return await asyncio.shield(self._snapshot)
+        except Exception:
+            self._snapshot = None
+            raise
+
+    def invalidate(self):
+        self._snapshot = None
+
+    def record(self, table_name: str, index_name: str | None = None):
+        # Our own DDL is applied to the snapshot instead of reloading it for every repository
+        snapshot = self._snapshot
+        if snapshot is None or not snapshot.done() or snapshot.cancelled() or snapshot.exception() is not None:
+            self.invalidate()
+            return
+
+        indexes = snapshot.result().setdefault(table_name, set())
+        if index_name is not None:
+            indexes.add(index_name)
+
+    async def _load(self) -> dict[str, set[str]]:
+        query = """
+            SELECT t.table_name, s.index_name
+            FROM information_schema.tables t
+            LEFT JOIN information_schema.statistics s
+              ON s.table_schema = t.table_schema
+             AND s.table_name = t.table_name
+            WHERE t.table_schema = %s
+        """
+
+        async with self.pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(query, (self.schema,))
+                rows = await cursor.fetchall()
+
+        tables: dict[str, set[str]] = {}
+        for table_name, index_name in rows:
+            indexes = tables.setdefault(table_name, set())
+            if index_name is not None:
+                indexes.add(index_name)
+        return tables
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from claybird.infrastructure.adapters.outbound.persistance.statement_cache import StatementCache
+
+
+class MysqlStatementCache(StatementCache):
+
+    placeholder = "%s"
+
+    def __init__(self, table_name: str, columns: tuple, pk: str):
+        super().__init__(table_name, columns, pk)
+
+        self._batch_head = f"INSERT INTO `{table_name}` ({self.column_list}) VALUES "
+        self._batch_tail = f" AS new ON DUPLICATE KEY UPDATE {self._updates(c for c in columns if c != pk)}"
+        self._batch_inserts: dict[int, str] = {}
+
+    def _build_save(self) -> str:
+        return (
+            f"INSERT INTO `{self.table_name}` ({self.column_list}) "
+            f"VALUES {self.row_placeholders} AS new "
+            f"ON DUPLICATE KEY UPDATE {self._updates(self.columns)}"
+        )
+
+    def batch_insert(self, row_count: int) -> str:
+        # Full chunks all share the same row count, so this is usually a hit
+        sql = self._batch_inserts.get(row_count)
+        if sql is None:
+            values_sql = ", ".join(self.row_placeholders for _ in range(row_count))
+            sql = self._batch_inserts[row_count] = f"{self._batch_head}{values_sql}{self._batch_tail}"
+        return sql
+
+    @staticmethod
+    def _updates(columns) -> str:
+        return ", ".join(f"`{c}` = new.`{c}`" for c in columns)
@@ -0,0 +1,11 @@
+from claybird.application.ports.outbound.unit_of_work_port import UnitOfWorkPort
+from claybird.infrastructure.adapters.outbound.persistance.mysql.mysql_pool_router import MysqlPoolRouter
+
+
+class MysqlUnitOfWork(UnitOfWorkPort):
+
+    def __init__(self, router: MysqlPoolRouter):
+        self.router = router
+
+    def transaction(self):
+        return self.router.transaction()
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from collections import namedtuple
+from dataclasses import fields as dataclass_fields, is_dataclass
+from typing import Any, Callable
+
+
+class Projection:
+
+    def __init__(self, spec: Any, columns: tuple):
+        if isinstance(spec, type) and is_dataclass(spec):
+            names = tuple(f.name for f in dataclass_fields(spec))
+            self.make: Callable[[tuple], Any] = lambda row: spec(*row)
+        else:
+            names = tuple(spec)
+            self.make = namedtuple("Projection", names)._make
+
+        unknown = [name for name in names if name not in columns]
+        if unknown:
+            raise ValueError(f"Unknown projection columns: {', '.join(unknown)}")
+
+        self.names = names
+        self.select = ", ".join(f"`{name}`" for name in names)
+        self._statements: dict[str, str] = {}
+
+    def statement(self, key: str, table_name: str, where: str | None = None) -> str:
+        sql = self._statements.get(key)
+        if sql is None:
+            sql = f"SELECT {self.select} FROM `{table_name}`"
+            if where:
+                sql += f" WHERE {where}"
+            self._statements[key] = sql
+        return sql
@@ -0,0 +1,631 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import time
+import warnings
+from abc import abstractmethod
+from dataclasses import Field as DataclassField
+from types import MethodType
+from typing import Any, AsyncIterable, AsyncIterator, Iterable
+
+from claybird.application.ports.outbound.crud_repository_port import BatchResult, CrudRepositoryPort, Page
+from claybird.domain.entities.entity import Entity
+from claybird.domain.entities.field import Field
+from claybird.infrastructure.adapters.shared import camel_to_snake
+from claybird.infrastructure.adapters.outbound.persistance.batch_loader import BatchLoader
+from claybird.infrastructure.adapters.outbound.persistance.entity_hydratator import EntityHydratator
+from claybird.infrastructure.adapters.outbound.persistance.finder_plan import FinderPlan
+from claybird.infrastructure.adapters.outbound.persistance.projection import Projection
+from claybird.infrastructure.adapters.outbound.persistance.statement_cache import StatementCache
+
+logger = logging.getLogger(__name__)
+
+
+class UnindexedQueryWarning(UserWarning):
+    pass
+
+
+class SqlCrudRepository(CrudRepositoryPort):
+    table_name: str | None = None
+    entity_cls: type[Entity]
+    entity_hydratator: EntityHydratator
+    statements: StatementCache
+    stream_chunk_size: int = 1000
+    page_size: int = 100
+    batch_size: int = 1000
+    batch_concurrency: int = 4
+    max_batch_bytes: int | None = None
+    in_chunk_size: int = 500
+    coalesce_gets: bool = True
+    # Return views that decode each field on first access instead of full entities
+    lazy_hydration: bool = False
+    sync_indexes: bool = True
+    # False trusts the schema to exist (e.g. managed by migrations) and skips DDL checks
+    schema_check: bool = True
+    # "warn", "log" or "ignore" finders that filter on unindexed columns
+    unindexed_queries: str = "warn"
+
+    # Engines provide their dialect through these
+    placeholder: str = "%s"
+    table_options: str = ""
+    index_if_not_exists: bool = False
+    # Longer index names are truncated and suffixed with a hash
+    max_identifier_length: int | None = None
+    plan_cls: type[FinderPlan] = FinderPlan
+    statement_cache_cls: type[StatementCache] = StatementCache
+    _plans: dict[tuple, FinderPlan] = {}
+    _TYPE_MAP: dict = {}
+
+    async def _lazy_init(self):
+        started = time.perf_counter()
+        self.table_name = self.table_name or camel_to_snake(self.entity_cls.__name__)
+        self.entity_hydratator = EntityHydratator(self.entity_cls)
+        self._hydrate = self.entity_hydratator.hydrate_lazy if self.lazy_hydration else self.entity_hydratator.hydrate
+        self.statements = self.statement_cache_cls(
+            self.table_name,
+            self.entity_hydratator.columns,
+            self.entity_cls.get_primary_key(),
+        )
+        self.get_loader = BatchLoader(self.get_many, self._get_one)
+        self._projections: dict[Any, Projection] = {}
+        # Column -> declared python type, in table order
+        self.column_types = dict(zip(self.entity_hydratator.columns, self._column_types(self.entity_cls)))
+        self.indexes = self._resolve_indexes()
+        self._indexed_columns = {self.entity_cls.get_primary_key()} | {
+            columns[0] for _, columns in self.indexes.values()
+        }
+        self._checked_plans: set[str] = set()
+
+        created_indexes: list[str] = []
+        if not self.schema_check:
+            action = "skipped"
+        elif not await self.table_exists():
+            created_indexes = await self.create_table()
+            action = "created"
+        else:
+            if self.sync_indexes:
+                created_indexes = await self.create_missing_indexes()
+            action = "checked"
+
+        self.init_report = {
+            "table": self.table_name,
+            "action": action,
+            "created_indexes": created_indexes,
+            "seconds": time.perf_counter() - started,
+        }
+
+    @property
+    def in_transaction(self) -> bool:
+        return False
+
+    def after_transaction(self, callback):
+        raise RuntimeError(f"{self.__class__.__name__} has no open transaction")
+
+    @abstractmethod
+    async def table_exists(self) -> bool:
+        pass
+
+    @abstractmethod
+    async def existing_indexes(self) -> set[str]:
+        pass
+
+    @abstractmethod
+    async def _fetch_rows(self, query: str, params: Iterable[Any] = ()) -> list[dict]:
+        pass
+
+    @abstractmethod
+    async def _fetch_tuples(self, query: str, params: Iterable[Any] = ()) -> list[tuple]:
+        pass
+
+    @abstractmethod
+    async def _execute(self, query: str, params: Iterable[Any] = ()) -> int:
+        pass
+
+    @abstractmethod
+    def _stream_rows(
+        self,
+        query: str,
+        params: Iterable[Any],
+        chunk_size: int,
+        as_tuples: bool = False,
+    ) -> AsyncIterator[list]:
+        pass
+
+    @abstractmethod
+    async def _insert_rows(self, rows: list[tuple]):
+        pass
+
+    async def create_table(self) -> list[str]:
+        columns = self._build_columns(self.entity_cls.get_fields())
+        query = f"""
+            CREATE TABLE IF NOT EXISTS `{self.table_name}` (
+                {", ".join(columns)}
+            ){self.table_options};
+        """
+        await self._execute(query)
+
+        for name in self.indexes:
+            await self._create_index(name)
+        return list(self.indexes)
+
+    async def create_missing_indexes(self) -> list[str]:
+        existing = await self.existing_indexes()
+        missing = [name for name in self.indexes if name not in existing]
+        for name in missing:
+            await self._create_index(name)
+        return missing
+
+    async def _create_index(self, name: str):
+        await self._execute(self._index_sql(name))
+
+    def _index_sql(self, name: str) -> str:
+        unique, columns = self.indexes[name]
+        return (
+            f"CREATE {'UNIQUE ' if unique else ''}INDEX {'IF NOT EXISTS ' if self.index_if_not_exists else ''}`{name}` "
+            f"ON `{self.table_name}` ({', '.join(self._index_column_sql(c) for c in columns)})"
+        )
+
+    def _index_column_sql(self, column: str) -> str:
+        return f"`{column}`"
+
+    def _index_name(self, name: str) -> str:
+        limit = self.max_identifier_length
+        if limit is None or len(name) <= limit:
+            return name
+        # Truncated names keep a hash of the full one so they stay unique and stable
+        digest = hashlib.sha1(name.encode()).hexdigest()[:8]
+        return f"{name[:limit - len(digest) - 1]}_{digest}"
+
+    def _resolve_indexes(self) -> dict[str, tuple[bool, tuple[str, ...]]]:
+        table_columns = self.entity_hydratator.columns
+        indexes = {}
+
+        for key, index in self.entity_cls.get_indexes().items():
+            columns: list[str] = []
+            for name in index.columns:
+                # Embedded fields expand to all of their columns
+                expanded = [name] if name in table_columns else [c for c in table_columns if c.startswith(f"{name}_")]
+                if not expanded:
+                    raise ValueError(f"Index '{key}' of {self.entity_cls.__name__} uses unknown column '{name}'")
+                columns.extend(expanded)
+
+            # Index names are per schema in some engines, so they carry the table name
+            name = self._index_name(f"{'ux' if index.unique else 'ix'}_{self.table_name}_{key}")
+            for column in columns:
+                # Fails early for columns the engine cannot index
+                self._index_column_sql(column)
+            indexes[name] = (index.unique, tuple(columns))
+
+        return indexes
+
+    def _check_plan(self, plan: FinderPlan):
+        self._checked_plans.add(plan.name)
+        if self.unindexed_queries == "ignore":
+            return
+
+        columns = [column for column, _, _ in plan.conditions]
+        unindexed = [column for column in columns if column not in self._indexed_columns]
+        # AND only needs one indexed column to narrow the scan, OR needs all of them
+        if not unindexed or ("_or_" not in plan.connectors and len(unindexed) < len(columns)):
+            return
+
+        message = (
+            f"{self.__class__.__name__}.{plan.name} on `{self.table_name}` "
+            f"filters on unindexed columns: {', '.join(unindexed)}"
+        )
+        if self.unindexed_queries == "log":
+            logger.warning(message)
+        else:
+            warnings.warn(message, UnindexedQueryWarning, stacklevel=4)
+
+    def _bind(self, plan: FinderPlan, values: tuple) -> list[Any]:
+        if plan.name not in self._checked_plans:
+            self._check_plan(plan)
+        return plan.bind(values)
+
+    def _build_columns(self, fields: dict[str, Field]) -> list[str]:
+        columns: list[str] = []
+
+        for name, field in fields.items():
+            if self.entity_hydratator.is_embedded_type(field.type_):
+                columns.extend(self._build_embedded_columns(name, field.type_))
+            else:
+                columns.append(self._column_sql(name, field))
+
+        return columns
+
+    def _build_embedded_columns(self, prefix: str, type_: type) -> list[str]:
+        embedded_fields = self.entity_hydratator.get_embedded_fields(type_)
+        columns = []
+
+        for sub_name, sub_field in embedded_fields.items():
+
+            if isinstance(sub_field, Field):
+                if self.entity_hydratator.is_embedded_type(sub_field.type_):
+                    columns.extend(self._build_embedded_columns(f"{prefix}_{sub_name}", sub_field.type_))
+                    continue
+                field = sub_field
+
+            elif isinstance(sub_field, DataclassField):
+                field = Field(type_=sub_field.type)
+
+            else:
+                field = Field(type_=sub_field.annotation)
+
+            columns.append(
+                self._column_sql(f"{prefix}_{sub_name}", field)
+            )
+
+        return columns
+
+    def _column_sql(self, name: str, field: Field) -> str:
+        column_type = self._resolve_column_type(field.type_)
+        parts = [f"`{name}` {column_type}"]
+
+        if field.primary_key:
+            parts.append("PRIMARY KEY")
+
+        if field.required:
+            parts.append("NOT NULL")
+
+        if field.default is not None and not callable(field.default):
+            default = str(field.default).replace("'", "''")
+            parts.append(f"DEFAULT '{default}'")
+
+        return " ".join(parts)
+
+    def _column_types(self, type_: type) -> list:
+        hydratator = self.entity_hydratator
+        types = []
+        for field in hydratator.get_embedded_fields(type_).values():
+            sub_type = getattr(field, "type_", None) or getattr(field, "type", None) or getattr(field, "annotation", None)
+            if hydratator.is_embedded_type(sub_type):
+                types.extend(self._column_types(sub_type))
+            else:
+                types.append(sub_type)
+        return types
+
+    def _resolve_column_type(self, python_type: type) -> str:
+        return self._TYPE_MAP.get(python_type, "VARCHAR(255)")
+
+    def _row(self, entity: Entity) -> tuple:
+        return tuple(self.entity_hydratator.deshydrate(entity).values())
+
+    async def save(self, entity: Entity):
+        await self._execute(self.statements.save, self._row(entity))
+
+    async def save_batch(
+        self,
+        entities: Iterable[Entity] | AsyncIterable[Entity],
+        batch_size: int | None = None,
+        concurrency: int | None = None,
+    ) -> BatchResult:
+        started = time.perf_counter()
+        batch_size = batch_size or self.batch_size
+        max_bytes = None
+        semaphore = asyncio.Semaphore(concurrency or self.batch_concurrency)
+        to_row = self._row
+
+        tasks: list[asyncio.Future] = []
+        failures: list[BaseException] = []
+        chunk: list[tuple] = []
+        chunk_bytes = 0
+        total = 0
+
+        async def insert(rows: list[tuple]):
+            try:
+                await self._insert_rows(rows)
+            except BaseException as error:
+                failures.append(error)
+                raise
+            finally:
+                semaphore.release()
+
+        async def dispatch(rows: list[tuple]):
+            # Waiting for a free slot keeps at most `concurrency` chunks in memory
+            await semaphore.acquire()
+            if failures:
+                semaphore.release()
+                raise failures[0]
+            tasks.append(asyncio.ensure_future(insert(rows)))
+
+        try:
+            async for entity in self._iterate(entities):
+                # Nothing is dispatched after the first failed chunk
+                if failures:
+                    raise failures[0]
+                if total == 0:
+                    max_bytes = await self._max_batch_bytes()
+
+                row = to_row(entity)
+
+                if max_bytes is None:
+                    if len(chunk) >= batch_size:
+                        await dispatch(chunk)
+                        chunk = []
+                else:
+                    row_bytes = self._estimate_row_bytes(row)
+                    if chunk and (len(chunk) >= batch_size or chunk_bytes + row_bytes > max_bytes):
+                        await dispatch(chunk)
+                        chunk, chunk_bytes = [], 0
+                    chunk_bytes += row_bytes
+
+                chunk.append(row)
+                total += 1
+
+            if chunk:
+                await dispatch(chunk)
+        finally:
+            # Chunks already running finish before returning, even when the source failed
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        return BatchResult(rows=total, chunks=len(tasks), seconds=time.perf_counter() - started)
+
+    async def _max_batch_bytes(self) -> int | None:
+        return self.max_batch_bytes
+
+    @staticmethod
+    def _estimate_row_bytes(row: tuple) -> int:
+        size = 2 * len(row) + 2
+        for value in row:
+            if value is None:
+                size += 4
+            elif isinstance(value, (bytes, bytearray)):
+                size += 2 * len(value) + 3
+            elif isinstance(value, str):
+                size += len(value.encode()) + 2
+            else:
+                size += len(str(value)) + 2
+        return size
+
+    @staticmethod
+    async def _iterate(entities: Iterable[Any] | AsyncIterable[Any]):
+        if hasattr(entities, "__aiter__"):
+            async for entity in entities:
+                yield entity
+        else:
+            for entity in entities:
+                yield entity
+
+    async def get(self, id_: Any, fields: Any = None):
+        if fields is not None:
+            projection = self._projection(fields)
+            where = f"`{self.entity_cls.get_primary_key()}` = {self.placeholder}"
+            rows = await self._fetch_projected(projection, projection.statement("get", self.table_name, where), (id_,))
+            return rows[0] if rows else None
+
+        if self.coalesce_gets:
+            return await self.get_loader.load(id_)
+        return await self._get_one(id_)
+
+    async def _get_one(self, id_: Any):
+        rows = await self._fetch_rows(self.statements.get, (id_,))
+        if not rows:
+            return None
+        return self._hydrate(rows[0])
+
+    async def get_many(self, ids: Iterable[Any]) -> list[Entity | None]:
+        ids = list(ids)
+        unique_ids = list({str(id_): id_ for id_ in ids}.values())
+        pk = self.entity_cls.get_primary_key()
+        rows_by_key: dict[str, dict] = {}
+
+        for start in range(0, len(unique_ids), self.in_chunk_size):
+            chunk = unique_ids[start:start + self.in_chunk_size]
+            for row in await self._fetch_rows(self.statements.get_many(len(chunk)), chunk):
+                rows_by_key[str(row[pk])] = row
+
+        hydrate = self._hydrate
+        entities = {key: hydrate(row) for key, row in rows_by_key.items()}
+        return [entities.get(str(id_)) for id_ in ids]
+
+    async def delete(self, id_: Any):
+        await self._execute(self.statements.delete, (id_,))
+
+    async def get_all(self, fields: Any = None):
+        if fields is not None:
+            projection = self._projection(fields)
+            return await self._fetch_projected(projection, projection.statement("get_all", self.table_name))
+
+        return await self._fetch_entities(self.statements.get_all)
+
+    async def stream_all(self, chunk_size: int | None = None, fields: Any = None):
+        if fields is None:
+            query, projection = self.statements.get_all, None
+        else:
+            projection = self._projection(fields)
+            query = projection.statement("get_all", self.table_name)
+
+        async for item in self._stream(query, (), chunk_size, projection):
+            yield item
+
+    async def _stream(
+        self,
+        query: str,
+        params: Iterable[Any],
+        chunk_size: int | None = None,
+        projection: Projection | None = None,
+    ):
+        convert = self._hydrate if projection is None else projection.make
+
+        chunk_size = chunk_size or self.stream_chunk_size
+        async for rows in self._stream_rows(query, params, chunk_size, as_tuples=projection is not None):
+            for row in rows:
+                yield convert(row)
+
+    def _projection(self, fields: Any) -> Projection:
+        key = fields if isinstance(fields, type) else tuple(fields)
+        projection = self._projections.get(key)
+        if projection is None:
+            projection = self._projections[key] = Projection(key, self.entity_hydratator.columns)
+        return projection
+
+    async def _fetch_projected(self, projection: Projection, query: str, params: Iterable[Any] = ()) -> list:
+        make = projection.make
+        return [make(r) for r in await self._fetch_tuples(query, params)]
+
+    async def _fetch_entities(self, query: str, params: Iterable[Any] = ()) -> list[Entity]:
+        hydrate = self._hydrate
+        return [hydrate(r) for r in await self._fetch_rows(query, params)]
+
+    async def page(self, after: Any = None, limit: int | None = None, order_by: str | None = None):
+        return await self._page(None, [], after, limit, order_by)
+
+    async def _page(
+        self,
+        where: str | None,
+        params: list[Any],
+        after: Any,
+        limit: int | None,
+        order_by: str | None,
+    ) -> Page:
+        limit = limit or self.page_size
+        pk = self.entity_cls.get_primary_key()
+        column, descending = self._parse_order_by(order_by or pk)
+        keyset = (pk,) if column == pk else (column, pk)
+        direction = "DESC" if descending else "ASC"
+
+        clauses = [f"({where})"] if where else []
+        params = list(params)
+
+        if after is not None:
+            after_values = after if len(keyset) > 1 else (after,)
+            if len(after_values) != len(keyset):
+                raise ValueError(f"'after' must provide values for {keyset}")
+
+            clause, clause_params = self._keyset_clause(keyset, after_values, descending)
+            clauses.append(clause)
+            params.extend(clause_params)
+
+        query = f"SELECT * FROM `{self.table_name}`"
+        if clauses:
+            query += f" WHERE {' AND '.join(clauses)}"
+        query += f" ORDER BY {', '.join(f'`{k}` {direction}' for k in keyset)} LIMIT {self.placeholder}"
+        params.append(limit + 1)
+
+        rows = await self._fetch_rows(query, params)
+
+        next_after = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_after = last[pk] if len(keyset) == 1 else tuple(last[k] for k in keyset)
+
+        return Page(items=[self._hydrate(r) for r in rows], next_after=next_after)
+
+    def _keyset_clause(self, keyset: tuple[str, ...], after: tuple, descending: bool) -> tuple[str, list[Any]]:
+        op = "<" if descending else ">"
+        if len(keyset) == 1:
+            return f"`{keyset[0]}` {op} {self.placeholder}", list(after)
+
+        # NULLs sort first ascending and last descending, and never match a row comparison
+        (column, pk), (value, pk_value) = keyset, after
+        if value is None:
+            clause = f"(`{column}` IS NULL AND `{pk}` {op} {self.placeholder})"
+            if not descending:
+                clause = f"({clause} OR `{column}` IS NOT NULL)"
+            return clause, [pk_value]
+
+        clause = f"(`{column}`, `{pk}`) {op} ({self.placeholder}, {self.placeholder})"
+        if descending:
+            clause = f"({clause} OR `{column}` IS NULL)"
+        return clause, [value, pk_value]
+
+    def _parse_order_by(self, order_by: str) -> tuple[str, bool]:
+        descending = order_by.startswith("-")
+        column = order_by.lstrip("-")
+        field = self.entity_cls.get_fields().get(column)
+
+        if field is None or self.entity_hydratator.is_embedded_type(field.type_):
+            raise ValueError(f"Cannot order {self.entity_cls.__name__} by '{column}'")
+
+        return column, descending
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(f"{self.__class__.__name__} has no attribute {name}")
+
+        # Plans depend on the entity columns, so they are shared per (name, columns)
+        entity_cls = self.__dict__.get("entity_cls")
+        columns = frozenset(EntityHydratator(entity_cls).columns) if entity_cls is not None else None
+        key = (name, columns)
+        plan = self._plans.get(key)
+        if plan is None:
+            try:
+                plan = self.plan_cls.compile(name, columns)
+            except ValueError as e:
+                raise AttributeError(f"{self.__class__.__name__}.{name}: {e}") from e
+            if plan is None:
+                raise AttributeError(f"{self.__class__.__name__} has no attribute {name}")
+            self._plans[key] = plan
+
+        # Bound on the instance so later lookups skip __getattr__
+        method = self.__dict__[name] = MethodType(self._build_dynamic_method(plan), self)
+        return method
+
+    @staticmethod
+    def _build_dynamic_method(plan: FinderPlan):
+        if plan.action == "stream":
+            async def stream(self, *values, chunk_size: int | None = None, fields: Any = None):
+                if fields is None:
+                    sql, projection = plan.statement(self.table_name, values), None
+                else:
+                    projection = self._projection(fields)
+                    sql = plan.statement(self.table_name, values, projection.select)
+
+                async for item in self._stream(sql, self._bind(plan, values), chunk_size, projection):
+                    yield item
+
+            method = stream
+
+        elif plan.action == "page":
+            async def page(self, *values, after: Any = None, limit: int | None = None, order_by: str | None = None):
+                return await self._page(plan.where_for(values), self._bind(plan, values), after, limit, order_by)
+
+            method = page
+
+        elif plan.action == "find":
+            async def find(self, *values, fields: Any = None):
+                if fields is None:
+                    items = await self._fetch_entities(plan.statement(self.table_name, values), self._bind(plan, values))
+                else:
+                    projection = self._projection(fields)
+                    sql = plan.statement(self.table_name, values, projection.select)
+                    items = await self._fetch_projected(projection, sql, self._bind(plan, values))
+
+                if plan.single:
+                    return items[0] if items else None
+                return items
+
+            method = find
+
+        elif plan.action in ("count", "aggregate"):
+            async def scalar(self, *values):
+                rows = await self._fetch_tuples(plan.statement(self.table_name, values), self._bind(plan, values))
+                return rows[0][0]
+
+            method = scalar
+
+        elif plan.action == "group_count":
+            async def group_count(self, *values):
+                return dict(await self._fetch_tuples(plan.statement(self.table_name, values), self._bind(plan, values)))
+
+            method = group_count
+
+        elif plan.action == "delete":
+            async def delete(self, *values):
+                return await self._execute(plan.statement(self.table_name, values), self._bind(plan, values))
+
+            method = delete
+
+        else:
+            raise ValueError(f"Unknown action {plan.action}")
+
+        method.__name__ = method.__qualname__ = plan.name
+        return method
@@ -0,0 +1,40 @@
+from claybird.application.ports.outbound.connection_handler_port import ConnectionHandlerPort
+from claybird.application.ports.outbound.crud_repository_port import CrudRepositoryPort
+
+
+class SqliteConnectionHandler(ConnectionHandlerPort):
+
+    async def start_connection(self, definition: dict) -> dict:
+        from claybird.infrastructure.adapters.outbound.persistance.sqlite.sqlite_pool import SqlitePool
+
+        connection = {
+            "engine": definition.get("engine"),
+            "path": definition.get("path"),
+            "readers": int(definition.get("readers", 4)),
+            "schema_check": definition.get("schema_check", True),
+        }
+
+        if not connection["path"]:
+            raise ValueError("Invalid SQLite connection definition")
+
+        connection["pool"] = await SqlitePool(
+            connection["path"],
+            readers=connection["readers"],
+        ).open()
+
+        return connection
+
+    async def get_engine_adapter(self, connection: dict, port: type):
+        pool = connection.get("pool")
+        if pool is None:
+            raise ValueError("SQLite pool not initialized")
+
+        if port is CrudRepositoryPort:
+            from claybird.infrastructure.adapters.outbound.persistance.sqlite.sqlite_crud_repository import SqliteCrudRepository
+            repository = SqliteCrudRepository(pool)
+            repository.schema_check = connection.get("schema_check", True)
+            return repository
+
+        raise KeyError(
+            f"{port.__name__} is not implemented for SQLite engine"
+        )
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import datetime
+import json
+import uuid
+import decimal
+import sqlite3
+from enum import Enum
+from typing import Any, Iterable
+
+from claybird.infrastructure.adapters.outbound.events import EventBus
+from claybird.domain.entities import field_type
+from claybird.infrastructure.adapters.outbound.persistance.sql_crud_repository import SqlCrudRepository
+from claybird.infrastructure.adapters.outbound.persistance.sqlite.sqlite_finder_plan import SqliteFinderPlan
+from claybird.infrastructure.adapters.outbound.persistance.sqlite.sqlite_pool import SqlitePool
+from claybird.infrastructure.adapters.outbound.persistance.sqlite.sqlite_statement_cache import SqliteStatementCache
+from claybird.infrastructure.adapters.outbound.persistance.sqlite.sqlite_types import register_enum
+
+class SqliteCrudRepository(SqlCrudRepository):
+    statements: SqliteStatementCache
+    # There is a single writer; a second slot lets the next chunk be built
+    # while the previous one is being written
+    batch_concurrency: int = 2
+
+    placeholder = "?"
+    index_if_not_exists = True
+    plan_cls = SqliteFinderPlan
+    statement_cache_cls = SqliteStatementCache
+    _plans: dict[tuple, SqliteFinderPlan] = {}
+
+    _TYPE_MAP = {
+        str: "VARCHAR(255)",
+        field_type.TEXT: "TEXT",
+        int: "INTEGER",
+        float: "REAL",
+        bool: "BOOLEAN",
+        bytes: "BLOB",
+        datetime.datetime: "DATETIME",
+        datetime.date: "DATE",
+        uuid.UUID: "CHAR(36)",
+        # The trailing TEXT gives the column text affinity so values keep
+        # their precision; the converter is chosen by the first word
+        decimal.Decimal: "DECIMAL TEXT",
+        field_type.JSON: "JSON"
+    }
+
+    def __init__(self, pool: SqlitePool):
+        self.pool = pool
+
+    @EventBus.on("start")
+    async def _lazy_init(self):
+        await super()._lazy_init()
+        self._register_enums(self.entity_cls)
+        # JSON is encoded per column rather than through a process-wide dict/list adapter
+        self._json_positions = tuple(
+            position
+            for position, type_ in enumerate(self.column_types.values())
+            if type_ == field_type.JSON
+        )
+
+    def _register_enums(self, type_: type):
+        hydratator = self.entity_hydratator
+        for field in hydratator.get_embedded_fields(type_).values():
+            sub_type = getattr(field, "type_", None) or getattr(field, "type", None) or getattr(field, "annotation", None)
+            if isinstance(sub_type, type) and issubclass(sub_type, Enum):
+                register_enum(sub_type)
+            elif hydratator.is_embedded_type(sub_type):
+                self._register_enums(sub_type)
+
+    def _row(self, entity) -> tuple:
+        row = super()._row(entity)
+        if not self._json_positions:
+            return row
+
+        row = list(row)
+        for position in self._json_positions:
+            if row[position] is not None:
+                row[position] = json.dumps(row[position])
+        return tuple(row)
+
+    async def table_exists(self) -> bool:
+        query = "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = ?"
+        rows = await self.pool.writer.run(self._select, self.pool.writer.raw, query, (self.table_name,), True)
+        return rows[0][0] > 0
+
+    async def existing_indexes(self) -> set[str]:
+        query = "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ?"
+        rows = await self.pool.writer.run(self._select, self.pool.writer.raw, query, (self.table_name,), True)
+        return {name for (name,) in rows}
+
+    async def _fetch_rows(self, query: str, params: Iterable[Any] = ()) -> list[dict]:
+        async with self.pool.read() as conn:
+            return await conn.run(self._select, conn.raw, query, params, False)
+
+    async def _fetch_tuples(self, query: str, params: Iterable[Any] = ()) -> list[tuple]:
+        async with self.pool.read() as conn:
+            return await conn.run(self._select, conn.raw, query, params, True)
+
+    async def _execute(self, query: str, params: Iterable[Any] = ()) -> int:
+        writer = self.pool.writer
+        return await writer.run(self._write, writer.raw, query, params)
+
+    async def _stream_rows(self, query: str, params: Iterable[Any], chunk_size: int, as_tuples: bool = False):
+        async with self.pool.read() as conn:
+            cursor = await conn.run(conn.raw.execute, query, tuple(params))
+            columns = [d[0] for d in cursor.description]
+            try:
+                while True:
+                    rows = await conn.run(cursor.fetchmany, chunk_size)
+                    if not rows:
+                        break
+                    yield rows if as_tuples else [dict(zip(columns, row)) for row in rows]
+            finally:
+                await conn.run(cursor.close)
+
+    async def _insert_rows(self, rows: list[tuple]):
+        writer = self.pool.writer
+        await writer.run(self._write_many, writer.raw, self.statements.save, rows)
+
+    @staticmethod
+    def _select(raw: sqlite3.Connection, query: str, params: Iterable[Any], as_tuples: bool) -> list:
+        cursor = raw.execute(query, tuple(params))
+        rows = cursor.fetchall()
+        if as_tuples:
+            return rows
+        columns = [d[0] for d in cursor.description]
+        return [dict(zip(columns, row)) for row in rows]
+
+    @staticmethod
+    def _write(raw: sqlite3.Connection, query: str, params: Iterable[Any]) -> int:
+        return raw.execute(query, tuple(params)).rowcount
+
+    @staticmethod
+    def _write_many(raw: sqlite3.Connection, query: str, rows: list[tuple]):
+        # One transaction per chunk instead of one per row
+        raw.execute("BEGIN")
+        try:
+            raw.executemany(query, rows)
+        except BaseException:
+            raw.execute("ROLLBACK")
+            raise
+        raw.execute("COMMIT")
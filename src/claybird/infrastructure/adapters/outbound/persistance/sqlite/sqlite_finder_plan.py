@@ -0,0 +1,6 @@
+from claybird.infrastructure.adapters.outbound.persistance.finder_plan import FinderPlan
+
+
+class SqliteFinderPlan(FinderPlan):
+
+    placeholder = "?"
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, Callable
+
+from claybird.infrastructure.adapters.outbound.persistance.sqlite.sqlite_types import register_types
+
+
+class SqliteConnection:
+
+    def __init__(self, path: str, pragmas: dict[str, Any]):
+        self.path = path
+        self.pragmas = pragmas
+        self.raw: sqlite3.Connection | None = None
+        # A sqlite3 connection must stay on the thread that opened it, so each
+        # one gets its own single worker
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="claybird-sqlite")
+
+    async def open(self):
+        self.raw = await self.run(self._connect)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            isolation_level=None,
+            uri=self.path.startswith("file:"),
+        )
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        return conn
+
+    async def run(self, fn: Callable, *args: Any):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    async def close(self):
+        if self.raw is not None:
+            await self.run(self.raw.close)
+            self.raw = None
+        self.executor.shutdown(wait=False)
+
+
+class SqlitePool:
+
+    def __init__(self, path: str, readers: int = 4, busy_timeout: int = 5000):
+        self.path = path
+        # In-memory databases are private to their connection, so everything
+        # goes through the writer
+        self.readers = 0 if self.is_memory(path) else readers
+        self.busy_timeout = busy_timeout
+        self.writer: SqliteConnection | None = None
+        self._readers: list[SqliteConnection] = []
+        self._idle: asyncio.Queue[SqliteConnection] | None = None
+
+    @staticmethod
+    def is_memory(path: str) -> bool:
+        return path == ":memory:" or "mode=memory" in path
+
+    async def open(self) -> SqlitePool:
+        register_types()
+
+        self.writer = SqliteConnection(self.path, {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "busy_timeout": self.busy_timeout,
+        })
+        await self.writer.open()
+
+        self._idle = asyncio.Queue()
+        for _ in range(self.readers):
+            reader = SqliteConnection(self.path, {
+                "query_only": "ON",
+                "busy_timeout": self.busy_timeout,
+            })
+            await reader.open()
+            self._readers.append(reader)
+            self._idle.put_nowait(reader)
+
+        return self
+
+    @asynccontextmanager
+    async def read(self):
+        if not self._readers:
+            yield self.writer
+            return
+
+        conn = await self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put_nowait(conn)
+
+    async def close(self):
+        for conn in (*self._readers, self.writer):
+            if conn is not None:
+                await conn.close()
+        self._readers.clear()
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from claybird.infrastructure.adapters.outbound.persistance.statement_cache import StatementCache
+
+
+class SqliteStatementCache(StatementCache):
+
+    placeholder = "?"
+
+    def _build_save(self) -> str:
+        updates = ", ".join(f"`{c}` = excluded.`{c}`" for c in self.columns if c != self.pk)
+        action = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+        return (
+            f"INSERT INTO `{self.table_name}` ({self.column_list}) "
+            f"VALUES {self.row_placeholders} "
+            f"ON CONFLICT(`{self.pk}`) {action}"
+        )
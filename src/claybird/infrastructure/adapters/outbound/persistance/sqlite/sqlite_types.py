@@ -0,0 +1,29 @@
+import datetime
+import decimal
+import json
+import sqlite3
+import uuid
+from enum import Enum
+
+
+def _enum_value(value: Enum):
+    return value.value
+
+
+def register_enum(enum_cls: type[Enum]):
+    # sqlite3 looks adapters up by exact type, so every Enum needs its own
+    sqlite3.register_adapter(enum_cls, _enum_value)
+
+
+def register_types():
+    sqlite3.register_adapter(uuid.UUID, str)
+    sqlite3.register_adapter(decimal.Decimal, str)
+    sqlite3.register_adapter(datetime.datetime, lambda value: value.isoformat(" "))
+    sqlite3.register_adapter(datetime.date, lambda value: value.isoformat())
+
+    # Converters are picked by the first word of the declared column type
+    sqlite3.register_converter("BOOLEAN", lambda value: value != b"0")
+    sqlite3.register_converter("DATETIME", lambda value: datetime.datetime.fromisoformat(value.decode()))
+    sqlite3.register_converter("DATE", lambda value: datetime.date.fromisoformat(value.decode()))
+    sqlite3.register_converter("DECIMAL", lambda value: decimal.Decimal(value.decode()))
+    sqlite3.register_converter("JSON", json.loads)
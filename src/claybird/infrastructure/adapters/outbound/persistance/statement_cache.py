@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+class StatementCache(ABC):
+
+    placeholder = "%s"
+
+    def __init__(self, table_name: str, columns: tuple, pk: str):
+        self.table_name = table_name
+        self.columns = columns
+        self.pk = pk
+
+        self.column_list = ", ".join(f"`{c}`" for c in columns)
+        self.row_placeholders = "(" + ", ".join(self.placeholder for _ in columns) + ")"
+
+        self.get = f"SELECT * FROM `{table_name}` WHERE `{pk}` = {self.placeholder}"
+        self.get_all = f"SELECT * FROM `{table_name}`"
+        self.delete = f"DELETE FROM `{table_name}` WHERE `{pk}` = {self.placeholder}"
+        self.save = self._build_save()
+
+        self._get_many: dict[int, str] = {}
+
+    @abstractmethod
+    def _build_save(self) -> str:
+        pass
+
+    def get_many(self, id_count: int) -> str:
+        sql = self._get_many.get(id_count)
+        if sql is None:
+            placeholders = ", ".join(self.placeholder for _ in range(id_count))
+            sql = self._get_many[id_count] = f"{self.get_all} WHERE `{self.pk}` IN ({placeholders})"
+        return sql
@@ -1,3 +1,5 @@
+import asyncio
+
 from claybird.application.ports.outbound.dependency_container_port import DependencyContainerPort
 from claybird.infrastructure.factories.connection_handler_factory import ConnectionHandlerFactory
 
@@ -9,8 +11,10 @@ class ConnectionsBootstrap:
 
     async def load_connections_from_settings(self):
         settings = self.container.get("settings")
-        for name, definition in settings.CONNECTIONS.items():
-            await self.load_connection(name, definition)
+        await asyncio.gather(*(
+            self.load_connection(name, definition)
+            for name, definition in settings.CONNECTIONS.items()
+        ))
     
     async def load_connection(self, name: str, definition: dict):
         engine = definition.get("engine", None)
@@ -1,3 +1,5 @@
+import asyncio
+
 from claybird.application.ports.outbound.dependency_container_port import DependencyContainerPort
 from claybird.application.ports.outbound.dependency_injector_port import DependencyInjectorPort
 from claybird.application.ports.inbound.controller_handler_port import ControllerHandlerPort
@@ -10,7 +12,10 @@ class ControllersBootstrap:
         self.controller_handler: ControllerHandlerPort = self.container.get(ControllerHandlerPort)
 
     async def load_controllers(self):
+        self.controller_handler.use_request_scope(self.dependency_injector.request_scope)
         controllers = self.controller_handler.get_controllers()
-        for controller in controllers:
-            injected_controller = await self.dependency_injector.inject(controller)
+        injected_controllers = await asyncio.gather(
+            *(self.dependency_injector.inject(controller) for controller in controllers)
+        )
+        for injected_controller in injected_controllers:
             self.controller_handler.load_controller(injected_controller)
\ No newline at end of file
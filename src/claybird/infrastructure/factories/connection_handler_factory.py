@@ -1,18 +1,26 @@
 from claybird.application.ports.outbound.connection_handler_port import ConnectionHandlerPort
 from claybird.application.ports.outbound.dependency_container_port import DependencyContainerPort
 from claybird.infrastructure.adapters.outbound.persistance.mysql.mysql_connection_handler import MysqlConnectionHandler
+from claybird.infrastructure.adapters.outbound.persistance.sqlite.sqlite_connection_handler import SqliteConnectionHandler
 
 class ConnectionHandlerFactory:
 
     _handlers = {
-        "mysql": MysqlConnectionHandler
+        "mysql": MysqlConnectionHandler,
+        "sqlite": SqliteConnectionHandler,
     }
 
     def __init__(self, container: DependencyContainerPort):
         self.container = container
+        self._instances: dict[str, ConnectionHandlerPort] = {}
 
     def get_handler(self, engine: str) -> ConnectionHandlerPort:
+        instance = self._instances.get(engine)
+        if instance is not None:
+            return instance
+
         handler = self._handlers.get(engine, None)
         if handler is None:
             raise KeyError(f"{engine} is not a valid engine")
-        return handler(self.container)
\ No newline at end of file
+        instance = self._instances[engine] = handler(self.container)
+        return instance
\ No newline at end of file
@@ -0,0 +1,24 @@
+import pytest
+
+from claybird.application.ports.outbound.crud_repository_port import CrudRepositoryPort
+from claybird.infrastructure.adapters.outbound.persistance.sqlite.sqlite_connection_handler import SqliteConnectionHandler
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def sqlite_repository(tmp_path):
+    handler = SqliteConnectionHandler(None)
+    connection = await handler.start_connection({"engine": "sqlite", "path": str(tmp_path / "test.db")})
+
+    async def build(repository_cls):
+        adapter = await handler.get_engine_adapter(connection, CrudRepositoryPort)
+        repository = repository_cls(adapter)
+        await adapter._lazy_init()
+        return repository
+
+    yield build
+    await connection["pool"].close()
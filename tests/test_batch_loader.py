@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+from claybird.infrastructure.adapters.outbound.persistance.batch_loader import BatchLoader
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_concurrent_loads_share_one_batch():
+    calls = []
+
+    async def load_many(keys):
+        calls.append(keys)
+        return [key * 10 for key in keys]
+
+    loader = BatchLoader(load_many)
+    assert await asyncio.gather(loader.load(1), loader.load(2), loader.load(1)) == [10, 20, 10]
+    assert calls == [[1, 2]]
+
+
+async def test_failed_batch_fails_every_waiter():
+    async def load_many(keys):
+        raise LookupError("boom")
+
+    loader = BatchLoader(load_many)
+    results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+    assert [type(result) for result in results] == [LookupError, LookupError]
+
+
+async def test_cancelled_batch_cancels_every_waiter():
+    started = asyncio.Event()
+
+    async def load_many(keys):
+        started.set()
+        await asyncio.sleep(10)
+
+    loader = BatchLoader(load_many)
+    waiters = [asyncio.ensure_future(loader.load(key)) for key in (1, 2)]
+    await started.wait()
+
+    for task in loader.running:
+        task.cancel()
+
+    results = await asyncio.wait_for(asyncio.gather(*waiters, return_exceptions=True), 1)
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
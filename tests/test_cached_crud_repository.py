@@ -0,0 +1,101 @@
+import asyncio
+import contextvars
+from contextlib import asynccontextmanager
+
+import pytest
+
+from claybird.application.proxies.cached_crud_repository import CachedCrudRepository
+from claybird.domain.entities.entity import Entity
+from claybird.domain.entities.field import field
+from claybird.infrastructure.adapters.outbound.cache import MemoryCacheBackend
+from claybird.infrastructure.adapters.outbound.persistance.mysql.mysql_pool_router import MysqlPoolRouter
+
+pytestmark = pytest.mark.anyio
+
+
+class Account(Entity):
+    id = field(primary_key=True, type_=int)
+    balance = field(type_=int)
+
+
+class Connection:
+
+    def __init__(self, store):
+        self.store = store
+        self.staged = {}
+
+    async def begin(self):
+        self.staged = {}
+
+    async def commit(self):
+        self.store.update(self.staged)
+
+    async def rollback(self):
+        self.staged = {}
+
+
+class Pool:
+
+    def __init__(self, store):
+        self.store = store
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield Connection(self.store)
+
+
+# Rows written inside a transaction are only visible on its connection until the commit
+class Repository:
+
+    def __init__(self):
+        self.rows = {}
+        self.router = MysqlPoolRouter(Pool(self.rows))
+
+    @property
+    def in_transaction(self):
+        return self.router.in_transaction
+
+    def after_transaction(self, callback):
+        self.router.after_transaction(callback)
+
+    async def get(self, id):
+        async with self.router.connection() as conn:
+            staged = getattr(conn, "staged", {})
+            return staged.get(id, self.rows.get(id))
+
+    async def save(self, entity):
+        async with self.router.connection() as conn:
+            target = conn.staged if self.in_transaction else self.rows
+            target[entity.id] = entity
+
+
+@pytest.fixture
+def repository():
+    impl = Repository()
+    return impl, CachedCrudRepository(impl, MemoryCacheBackend())
+
+
+async def test_reads_inside_a_rolled_back_transaction_are_not_cached(repository):
+    impl, cached = repository
+    impl.rows[1] = Account(id=1, balance=10)
+
+    with pytest.raises(LookupError):
+        async with impl.router.transaction():
+            await cached.save(Account(id=1, balance=99))
+            assert (await cached.get(1)).balance == 99
+            raise LookupError
+
+    assert (await cached.get(1)).balance == 10
+
+
+async def test_reads_before_the_commit_are_invalidated_by_it(repository):
+    impl, cached = repository
+    impl.rows[1] = Account(id=1, balance=10)
+
+    async with impl.router.transaction():
+        await cached.save(Account(id=1, balance=20))
+        # Another request, outside the transaction, caches the committed version
+        other = await contextvars.Context().run(asyncio.ensure_future, cached.get(1))
+        assert other.balance == 10
+
+    assert (await cached.get(1)).balance == 20
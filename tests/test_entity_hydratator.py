@@ -0,0 +1,61 @@
+from dataclasses import dataclass
+from uuid import UUID, uuid4
+
+import pytest
+from pydantic import BaseModel
+
+from claybird.domain.entities.entity import Entity
+from claybird.domain.entities.field import field
+from claybird.infrastructure.adapters.outbound.persistance.entity_hydratator import EntityHydratator
+
+
+@dataclass
+class Position:
+    lat: int
+    lon: int
+
+
+class Address(BaseModel):
+    street: str
+    number: int
+
+
+class User(Entity):
+    id = field(primary_key=True, default=uuid4, type_=UUID)
+    position = field(type_=Position)
+    address = field(type_=Address)
+    name = field()
+
+
+def round_trips(hydratator, entity):
+    row = hydratator.deshydrate(entity)
+    return row, hydratator.hydrate(row), hydratator.reflective_hydrate(row)
+
+
+@pytest.mark.parametrize("position, address", [
+    (None, None),
+    (Position(1, 2), None),
+    (None, Address(street="Main", number=3)),
+])
+def test_none_embedded_values_round_trip(position, address):
+    hydratator = EntityHydratator(User)
+    user = User(position=position, address=address, name="ada")
+
+    row, compiled, reflective = round_trips(hydratator, user)
+
+    if position is None:
+        assert row["position_lat"] is None and row["position_lon"] is None
+    for hydrated in (compiled, reflective):
+        assert hydrated.id == user.id
+        assert hydrated.position == position
+        assert hydrated.address == address
+        assert hydrated.name == "ada"
+
+
+def test_embedded_value_with_some_null_columns_is_kept():
+    hydratator = EntityHydratator(User)
+    row = {"id": uuid4(), "position_lat": None, "position_lon": 4, "address_street": None, "address_number": None, "name": None}
+
+    for hydrated in (hydratator.hydrate(row), hydratator.reflective_hydrate(row)):
+        assert hydrated.position == Position(None, 4)
+        assert hydrated.address is None
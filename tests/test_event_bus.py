@@ -0,0 +1,54 @@
+import gc
+
+import pytest
+
+from claybird.infrastructure.adapters.outbound.events import EventBus, EventDispatchError
+
+pytestmark = pytest.mark.anyio
+
+
+class Listener:
+    calls = []
+
+    def __init__(self, n):
+        self.n = n
+
+    @EventBus.on("test_event")
+    async def handle(self, value):
+        self.calls.append((self.n, value))
+
+
+class FailingListener:
+
+    @EventBus.on("test_failure")
+    async def handle(self):
+        raise LookupError("boom")
+
+
+async def test_ordered_dispatch_follows_registration_order():
+    Listener.calls = []
+    listeners = [Listener(n) for n in range(5)]
+
+    await EventBus.emit_ordered("test_event", "x")
+
+    assert Listener.calls == [(n, "x") for n in range(5)]
+    del listeners
+
+
+async def test_instances_are_released_when_collected():
+    listener = Listener(0)
+    assert listener in EventBus.listeners("test_event")
+
+    del listener
+    gc.collect()
+    assert EventBus.listeners("test_event") == []
+
+
+async def test_errors_are_aggregated():
+    listeners = [FailingListener(), FailingListener()]
+
+    with pytest.raises(EventDispatchError) as error:
+        await EventBus.emit("test_failure")
+
+    assert [type(e) for e in error.value.errors] == [LookupError, LookupError]
+    del listeners
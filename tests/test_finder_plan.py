@@ -0,0 +1,36 @@
+import pytest
+
+from claybird.infrastructure.adapters.outbound.persistance.finder_plan import FinderPlan
+
+COLUMNS = frozenset({"id", "status", "amount", "logged_in", "created_at"})
+
+
+@pytest.mark.parametrize("name", [
+    "sum_foo",
+    "avg_foo_by_status",
+    "group_count_by_foo",
+    "group_count_by_status_where_foo",
+    "find_by_foo",
+    "find_by_status_order_by_foo_desc",
+])
+def test_unknown_columns_fail_at_compile_time(name):
+    with pytest.raises(ValueError, match="foo"):
+        FinderPlan.compile(name, COLUMNS)
+
+
+def test_aggregate_and_group_count_statements():
+    total = FinderPlan.compile("sum_amount_by_status", COLUMNS)
+    assert total.statement("orders") == "SELECT SUM(`amount`) FROM `orders` WHERE `status` = %s"
+
+    groups = FinderPlan.compile("group_count_by_status_where_amount_greater_than", COLUMNS)
+    assert groups.statement("orders") == (
+        "SELECT `status`, COUNT(*) FROM `orders` WHERE `amount` > %s GROUP BY `status`"
+    )
+
+
+def test_suffixes_only_apply_to_columns():
+    plan = FinderPlan.compile("find_by_logged_in_and_status_in_order_by_created_at_desc", COLUMNS)
+    assert plan.statement("users", (True, ["a", "b"])) == (
+        "SELECT * FROM `users` WHERE `logged_in` = %s AND `status` IN (%s, %s) ORDER BY `created_at` DESC"
+    )
+    assert plan.bind((True, ["a", "b"])) == [True, "a", "b"]
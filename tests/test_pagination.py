@@ -0,0 +1,58 @@
+import pytest
+
+from claybird.application.proxies.crud_repository import CrudRepository
+from claybird.domain.entities.entity import Entity
+from claybird.domain.entities.field import field
+
+pytestmark = pytest.mark.anyio
+
+
+class Person(Entity):
+    id = field(primary_key=True, type_=int)
+    name = field()
+    age = field(type_=int, required=False)
+
+
+class PersonRepository(CrudRepository[Person]):
+    table_name = "people"
+
+
+async def collect_pages(repository, limit, **kwargs):
+    pages, after = [], None
+    while True:
+        page = await repository.page(after=after, limit=limit, **kwargs)
+        pages.append([person.id for person in page.items])
+        if not page.has_next:
+            return pages
+        after = page.next_after
+
+
+async def test_page_walks_every_row_by_primary_key(sqlite_repository):
+    repository = await sqlite_repository(PersonRepository)
+    await repository.save_batch([Person(id=i, name=f"p{i}", age=i) for i in range(1, 8)])
+
+    assert await collect_pages(repository, 3) == [[1, 2, 3], [4, 5, 6], [7]]
+    assert await collect_pages(repository, 3, order_by="-id") == [[7, 6, 5], [4, 3, 2], [1]]
+
+
+@pytest.mark.parametrize("order_by, expected", [
+    ("age", [[2, 4], [1, 3], [5]]),
+    ("-age", [[5, 3], [1, 4], [2]]),
+])
+async def test_page_continues_past_null_order_values(sqlite_repository, order_by, expected):
+    repository = await sqlite_repository(PersonRepository)
+    ages = {1: 20, 2: None, 3: 30, 4: None, 5: 40}
+    await repository.save_batch([Person(id=i, name=f"p{i}", age=age) for i, age in ages.items()])
+
+    assert await collect_pages(repository, 2, order_by=order_by) == expected
+
+
+async def test_page_cursor_on_a_null_value(sqlite_repository):
+    repository = await sqlite_repository(PersonRepository)
+    await repository.save_batch([Person(id=1, name="a", age=None), Person(id=2, name="b", age=7)])
+
+    first = await repository.page(limit=1, order_by="age")
+    assert first.next_after == (None, 1)
+
+    second = await repository.page(after=first.next_after, limit=1, order_by="age")
+    assert [person.id for person in second.items] == [2]
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from claybird.infrastructure.adapters.outbound.dependencies.dependency_injector import DependencyInjector
+from claybird.infrastructure.adapters.outbound.dependencies.dict_dependency_container import DictDependencyContainer
+from claybird.infrastructure.adapters.outbound.dependencies.scope import ScopedProxy
+
+pytestmark = pytest.mark.anyio
+
+
+class RequestContext:
+    lifetime = "scoped"
+    closed = 0
+
+    def __init__(self):
+        self.items = []
+
+    def close(self):
+        RequestContext.closed += 1
+
+
+class Service:
+    lifetime = "singleton"
+    context: RequestContext
+
+
+class Handler:
+    service: Service
+    context: RequestContext
+
+
+@pytest.fixture
+def injector():
+    RequestContext.closed = 0
+    return DependencyInjector(DictDependencyContainer())
+
+
+async def test_scoped_dependencies_are_shared_within_a_request(injector):
+    handler = await injector.inject(Handler)
+    assert isinstance(handler.context, ScopedProxy)
+
+    async with injector.request_scope():
+        handler.context.items.append(1)
+        assert handler.service.context.items == [1]
+        assert isinstance(handler.context, RequestContext)
+
+    async with injector.request_scope():
+        assert handler.context.items == []
+
+    assert RequestContext.closed == 2
+
+
+async def test_concurrent_requests_get_their_own_instances(injector):
+    handler = await injector.inject(Handler)
+
+    async def request(n):
+        async with injector.request_scope():
+            handler.context.items.append(n)
+            await asyncio.sleep(0)
+            return list(handler.context.items)
+
+    assert await asyncio.gather(*(request(n) for n in range(5))) == [[n] for n in range(5)]
+
+
+async def test_tasks_outliving_their_request_cannot_use_its_scope(injector):
+    handler = await injector.inject(Handler)
+    release = asyncio.Event()
+
+    async def background():
+        await release.wait()
+        return handler.context.items
+
+    async with injector.request_scope():
+        task = asyncio.ensure_future(background())
+
+    release.set()
+    with pytest.raises(RuntimeError, match="request scope ended"):
+        await task
+
+    with pytest.raises(RuntimeError, match="outside of a request scope"):
+        handler.context.items
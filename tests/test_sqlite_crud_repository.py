@@ -0,0 +1,144 @@
+import datetime
+import decimal
+import enum
+from dataclasses import dataclass
+from uuid import UUID, uuid4
+
+import pytest
+
+from claybird.application.proxies.crud_repository import CrudRepository
+from claybird.domain.entities.entity import Entity
+from claybird.domain.entities.field import field
+
+pytestmark = pytest.mark.anyio
+
+
+class Color(enum.Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+@dataclass
+class Position:
+    lat: int
+    lon: int
+
+
+class Item(Entity):
+    id = field(primary_key=True, default=uuid4, type_=UUID)
+    name = field()
+    age = field(type_=int, required=False, index=True)
+    price = field(type_=decimal.Decimal, required=False)
+    created = field(type_=datetime.datetime, required=False)
+    active = field(type_=bool, required=False)
+    color = field(type_=Color, required=False)
+    position = field(type_=Position, required=False)
+
+
+class ItemRepository(CrudRepository[Item]):
+    table_name = "items"
+
+
+@pytest.fixture
+async def items(sqlite_repository):
+    return await sqlite_repository(ItemRepository)
+
+
+async def save_ages(repository, ages):
+    entities = [Item(name=f"n{i}", age=age) for i, age in enumerate(ages)]
+    await repository.save_batch(entities)
+    return entities
+
+
+async def test_round_trips_every_column_type(items):
+    item = Item(
+        name="ada",
+        age=36,
+        price=decimal.Decimal("12345678901234567.123456"),
+        created=datetime.datetime(2024, 1, 2, 3, 4, 5),
+        active=True,
+        color=Color.BLUE,
+        position=Position(1, 2),
+    )
+    await items.save(item)
+
+    loaded = await items.get(item.id)
+    assert (loaded.name, loaded.age, loaded.price, loaded.created, loaded.active, loaded.position) == (
+        item.name, item.age, item.price, item.created, True, item.position,
+    )
+    # Like MySQL's CHAR(36) and ENUM columns, UUIDs and enums come back as their stored text
+    assert (loaded.id, loaded.color) == (str(item.id), "blue")
+
+    empty = Item(name="empty")
+    await items.save(empty)
+    loaded = await items.get(str(empty.id))
+    assert (loaded.age, loaded.price, loaded.color, loaded.position) == (None, None, None, None)
+
+
+async def test_save_updates_and_delete_removes(items):
+    item = Item(name="ada", age=1)
+    await items.save(item)
+    item.age = 2
+    await items.save(item)
+
+    assert (await items.get(item.id)).age == 2
+    assert len(await items.get_all()) == 1
+
+    await items.delete(item.id)
+    assert await items.get(item.id) is None
+
+
+async def test_get_many_keeps_order_and_missing_ids(items):
+    first, second = await save_ages(items, [1, 2])
+
+    found = await items.get_many([second.id, uuid4(), first.id, second.id])
+    assert [item and item.id for item in found] == [str(second.id), None, str(first.id), str(second.id)]
+
+
+async def test_in_and_null_finders(items):
+    await save_ages(items, [1, 2, 3, None])
+
+    assert sorted(i.age for i in await items.find_by_age_in([1, 3, 5])) == [1, 3]
+    assert await items.find_by_age_in([]) == []
+    assert sorted(i.age for i in await items.find_by_age_not_in([1])) == [2, 3]
+    assert [i.name for i in await items.find_by_age_is_null()] == ["n3"]
+    assert await items.count_by_age_is_not_null() == 3
+    assert sorted(i.age for i in await items.find_by_age_between(2, 3)) == [2, 3]
+
+
+async def test_ordering_and_limits(items):
+    await save_ages(items, [3, 1, 2, 5, 4])
+
+    assert [i.age for i in await items.find_by_age_greater_than_order_by_age_desc(1)] == [5, 4, 3, 2]
+    assert (await items.find_first_by_age_less_than_order_by_age(4)).age == 1
+    assert [i.age for i in await items.find_top_2_by_age_is_not_null_order_by_age_desc()] == [5, 4]
+    assert await items.find_first_by_age_greater_than(10) is None
+
+
+async def test_streams_projections_and_aggregates(items):
+    await save_ages(items, [1, 2, 2, 3])
+
+    streamed = [i.age async for i in items.stream_by_age_greater_than(1, chunk_size=1)]
+    assert sorted(streamed) == [2, 2, 3]
+
+    rows = await items.find_by_age(1, fields=("name",))
+    assert rows[0].name == "n0"
+
+    assert await items.sum_age() == 8
+    assert await items.group_count_by_age() == {1: 1, 2: 2, 3: 1}
+    assert await items.delete_by_age_greater_than(1) == 3
+    assert await items.count_by_age_is_not_null() == 1
+
+
+async def test_finder_pages_continue_until_exhausted(items):
+    await save_ages(items, list(range(10)))
+
+    ages, after = [], None
+    while True:
+        page = await items.find_by_age_greater_than_page(2, after=after, limit=3, order_by="-age")
+        ages.extend(item.age for item in page.items)
+        if not page.has_next:
+            break
+        after = page.next_after
+
+    assert ages == [9, 8, 7, 6, 5, 4, 3]